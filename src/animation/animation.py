@@ -1,69 +1,161 @@
 """Animation creation utilities for reveal effects"""
 
+import cv2
 import numpy as np
 # Relative imports for grouped structure
 from ..config.config import (
     FPS, DIAGONAL_ANGLE,
     CURSOR_FADE_IN_FRAMES, CURSOR_FADE_OUT_FRAMES
 )
-from .path_generator import generate_diagonal_zigzag_path, create_diagonal_reveal_mask
+from ..cursor.cursor_utils import premultiply_cursor, cursor_blend_layers
+from ..image.image_utils import ensure_bgr_uint8, read_only_view
+from .path_generator import (
+    generate_diagonal_zigzag_path, create_reveal_projection, reveal_thresholds, reveal_band_rows
+)
 
 
 def create_single_reveal_animation(main_image, pencil_cursor, pencil_cursor_size,
-                                   reveal_duration, total_duration, zig_zag_amplitude):
+                                   reveal_duration, total_duration, zig_zag_amplitude,
+                                   include_hold=True):
     """Create frames for a single image reveal animation
 
     Args:
-        main_image: The image to reveal (numpy.ndarray)
-        pencil_cursor: Cursor image with alpha channel (numpy.ndarray, RGBA)
+        main_image: The image to reveal (numpy.ndarray, BGR uint8)
+        pencil_cursor: Cursor image with alpha channel (numpy.ndarray, BGRA)
         pencil_cursor_size: Size of the cursor in pixels
         reveal_duration: Duration of the reveal animation in seconds
         total_duration: Total duration including hold time in seconds
         zig_zag_amplitude: Amplitude of the zig-zag motion
+        include_hold: Append the static hold frames (False when the encoder pads them instead)
 
     Returns:
         list: List of frames (numpy.ndarray) for the animation
     """
-    frames = []
+    return list(iter_single_reveal_frames(main_image, pencil_cursor, pencil_cursor_size,
+                                          reveal_duration, total_duration, zig_zag_amplitude,
+                                          include_hold=include_hold))
+
+
+def iter_single_reveal_frames(main_image, pencil_cursor, pencil_cursor_size,
+                              reveal_duration, total_duration, zig_zag_amplitude,
+                              include_hold=True, reuse_buffer=False):
+    """Yield frames for a single image reveal animation one at a time
+
+    Lets the encoder consume frames as they are produced instead of holding the whole clip in RAM.
+
+    Args:
+        main_image: The image to reveal (numpy.ndarray, BGR uint8)
+        pencil_cursor: Cursor image with alpha channel (numpy.ndarray, BGRA)
+        pencil_cursor_size: Size of the cursor in pixels
+        reveal_duration: Duration of the reveal animation in seconds
+        total_duration: Total duration including hold time in seconds
+        zig_zag_amplitude: Amplitude of the zig-zag motion
+        include_hold: Yield the static hold frames (False when the encoder pads them instead)
+        reuse_buffer: Alternate between two preallocated reveal frame buffers (only for consumers
+                      that are done with a frame one step later, e.g. the ffmpeg pipe)
+
+    Yields:
+        numpy.ndarray: Next frame (hold frames are one read-only view of main_image)
+    """
+    # Frames stay BGR end to end (ffmpeg reads bgr24), so no color conversion pass is needed
+    ensure_bgr_uint8(main_image, "main_image")
+
     # Get dimensions from main_image
     height, width = main_image.shape[:2]
 
-    # Create white canvas once (optimization)
-    white_canvas = np.ones((height, width, 3), dtype=np.uint8) * 255
+    # Persistent canvas: starts white, revealed pixels are painted in as the cursor sweeps
+    canvas = np.full((height, width, 3), 255, dtype=np.uint8)
 
     # Generate zig-zag path
     reveal_frames = int(reveal_duration * FPS)
-    hold_frames = int((total_duration - reveal_duration) * FPS)
+    hold_frames = calculate_hold_frames(reveal_duration, total_duration) if include_hold else 0
     path = generate_diagonal_zigzag_path(width, height, zig_zag_amplitude,
                                         DIAGONAL_ANGLE, reveal_duration, FPS)
 
+    # Projection field is fixed for the whole animation. The swept threshold only grows
+    # (running max), so each frame reveals just the band between consecutive thresholds.
+    projection = create_reveal_projection(width, height, DIAGONAL_ANGLE)
+    thresholds = np.maximum.accumulate(reveal_thresholds(path, DIAGONAL_ANGLE))
+    reveal_mask = np.empty((height, width), dtype=np.uint8)
+    prev_threshold = np.float32(projection.min() - 1)
+
+    # Cursor blit rectangles for every frame, computed in one vectorized pass
+    cursor_bounds = _cursor_blit_bounds(path, pencil_cursor_size, width, height)
+
+    # Premultiply cursor once; per-frame blending then stays in uint8 cv2 ops
+    cursor_premul, cursor_alpha = premultiply_cursor(pencil_cursor)
+    # Fade steps repeat (only CURSOR_FADE_IN/OUT_FRAMES distinct opacities), so cache their layers
+    cursor_layer_cache = {1.0: cursor_blend_layers(cursor_premul, cursor_alpha)}
+    cursor_workspace = np.empty(cursor_premul.shape, dtype=np.uint8)
+    cursor_alphas = _cursor_alpha_schedule(reveal_frames).tolist()
+    # Ping-pong pair: the frame yielded last stays intact while the next one is built
+    frame_buffers = ((np.empty_like(canvas), np.empty_like(canvas))
+                     if reuse_buffer and reveal_frames else None)
+
     # Create reveal frames
     for frame_idx in range(reveal_frames):
-        # Get current cursor position
-        cursor_x, cursor_y = path[frame_idx]
-
-        # Create diagonal reveal mask
-        reveal_mask = create_diagonal_reveal_mask(width, height, cursor_x, cursor_y, DIAGONAL_ANGLE)
-
-        # Apply mask to reveal image (vectorized - faster than channel loop)
-        # Expand mask to 3 channels for broadcasting
-        mask_3d = (reveal_mask > 0)[:, :, np.newaxis]
-        frame = np.where(mask_3d, main_image, white_canvas)
+        # Newly crossed band (0/255): prev_threshold < projection <= threshold, limited to its rows
+        threshold = thresholds[frame_idx]
+        row_start, row_end = reveal_band_rows(float(prev_threshold), float(threshold),
+                                              width, height, DIAGONAL_ANGLE)
+        if row_end > row_start:
+            band = reveal_mask[row_start:row_end]
+            cv2.inRange(projection[row_start:row_end],
+                        float(np.nextafter(prev_threshold, np.float32(np.inf))), float(threshold), dst=band)
+            cv2.copyTo(main_image[row_start:row_end], band, canvas[row_start:row_end])
+        prev_threshold = threshold
+
+        # Frames kept by the consumer need their own buffer; streamed ones reuse one
+        if frame_buffers is not None:
+            frame = frame_buffers[frame_idx & 1]
+            np.copyto(frame, canvas)
+        else:
+            frame = canvas.copy()
 
         # Overlay pencil cursor with alpha blending and fade-in/fade-out
-        cursor_alpha_multiplier = _calculate_cursor_alpha(frame_idx, reveal_frames)
+        cursor_alpha_multiplier = cursor_alphas[frame_idx]
+        cursor_layers = cursor_layer_cache.get(cursor_alpha_multiplier)
+        if cursor_layers is None:
+            cursor_layers = cursor_blend_layers(cursor_premul, cursor_alpha, cursor_alpha_multiplier)
+            cursor_layer_cache[cursor_alpha_multiplier] = cursor_layers
 
         # Draw cursor on frame
-        _draw_cursor_on_frame(frame, pencil_cursor, cursor_x, cursor_y,
-                            pencil_cursor_size, cursor_alpha_multiplier)
+        _draw_cursor_on_frame(frame, cursor_layers, cursor_bounds[frame_idx], cursor_workspace)
 
-        frames.append(frame)
+        yield frame
 
-    # Hold the final fully revealed image
+    # Hold the final fully revealed image (one shared read-only view, never copied)
+    hold_frame = read_only_view(main_image)
     for _ in range(hold_frames):
-        frames.append(main_image.copy())
+        yield hold_frame
+
+
+def count_single_reveal_frames(reveal_duration, total_duration, include_hold=True):
+    """Number of frames iter_single_reveal_frames yields
+
+    Args:
+        reveal_duration: Duration of the reveal animation in seconds
+        total_duration: Total duration including hold time in seconds
+        include_hold: Whether hold frames are included
+
+    Returns:
+        int: Frame count
+    """
+    hold_frames = calculate_hold_frames(reveal_duration, total_duration) if include_hold else 0
+    return int(reveal_duration * FPS) + hold_frames
 
-    return frames
+
+def calculate_hold_frames(reveal_duration, total_duration):
+    """Number of static frames shown after the reveal finishes
+
+    Args:
+        reveal_duration: Duration of the reveal animation in seconds
+        total_duration: Total duration including hold time in seconds
+
+    Returns:
+        int: Hold frame count
+    """
+    return int((total_duration - reveal_duration) * FPS)
 
 
 def create_static_hold_frames(image, duration_seconds):
@@ -80,70 +172,79 @@ def create_static_hold_frames(image, duration_seconds):
     return [image.copy() for _ in range(num_frames)]
 
 
-def _calculate_cursor_alpha(frame_idx, total_frames):
-    """Calculate cursor alpha multiplier for fade in/out effect
+def _cursor_alpha_schedule(total_frames):
+    """Calculate cursor alpha multipliers for the fade in/out effect, for every frame at once
 
     Args:
-        frame_idx: Current frame index
         total_frames: Total number of frames in animation
 
     Returns:
-        float: Alpha multiplier (0.0 to 1.0)
+        numpy.ndarray: (total_frames,) float64 alpha multipliers (0.0 to 1.0)
     """
-    if frame_idx < CURSOR_FADE_IN_FRAMES:
-        # Fade in at the start
-        return frame_idx / CURSOR_FADE_IN_FRAMES
-    elif frame_idx > total_frames - CURSOR_FADE_OUT_FRAMES:
-        # Fade out at the end
-        frames_from_end = total_frames - frame_idx
-        return frames_from_end / CURSOR_FADE_OUT_FRAMES
-    else:
-        # Full opacity in the middle
-        return 1.0
-
-
-def _draw_cursor_on_frame(frame, pencil_cursor, cursor_x, cursor_y,
-                         pencil_cursor_size, alpha_multiplier):
-    """Draw cursor on frame with alpha blending
+    frame_idx = np.arange(total_frames, dtype=np.float64)
+    # Fade in at the start, fade out at the end, full opacity in the middle
+    fade_in = frame_idx / CURSOR_FADE_IN_FRAMES
+    fade_out = (total_frames - frame_idx) / CURSOR_FADE_OUT_FRAMES
+    return np.clip(np.minimum(fade_in, fade_out), 0.0, 1.0)
+
+
+def _cursor_blit_bounds(path, pencil_cursor_size, width, height):
+    """Precompute frame and cursor regions for each cursor position
 
     Args:
-        frame: Frame to draw on (modified in place)
-        pencil_cursor: Cursor image with alpha channel
-        cursor_x: Cursor X position
-        cursor_y: Cursor Y position
+        path: Cursor positions, (N, 2) int array of (x, y)
         pencil_cursor_size: Size of the cursor
-        alpha_multiplier: Alpha multiplier for fade effects
+        width: Frame width
+        height: Frame height
+
+    Returns:
+        numpy.ndarray: (N, 8) int32 rows of (y1, y2, x1, x2, cy1, cy2, cx1, cx2);
+        rows where the cursor is off-frame are all zero (empty regions)
     """
     cursor_half = pencil_cursor_size // 2
+    xs = path[:, 0].astype(np.int64)
+    ys = path[:, 1].astype(np.int64)
+
+    # Frame bounds
+    y1 = np.maximum(0, ys - cursor_half)
+    y2 = np.minimum(height, ys + cursor_half)
+    x1 = np.maximum(0, xs - cursor_half)
+    x2 = np.minimum(width, xs + cursor_half)
+
+    # Cursor region bounds
+    cy1 = np.maximum(0, cursor_half - (ys - y1))
+    cy2 = np.minimum(pencil_cursor_size, cursor_half + (y2 - ys))
+    cx1 = np.maximum(0, cursor_half - (xs - x1))
+    cx2 = np.minimum(pencil_cursor_size, cursor_half + (x2 - xs))
+
+    bounds = np.stack([y1, y2, x1, x2, cy1, cy2, cx1, cx2], axis=1).astype(np.int32)
+
+    # Only draw where the cursor is at least partially visible and regions match
+    visible = ((y2 > y1) & (x2 > x1) & (cy2 > cy1) & (cx2 > cx1)
+               & (cy2 - cy1 == y2 - y1) & (cx2 - cx1 == x2 - x1))
+    bounds[~visible] = 0
+    return bounds
 
-    # Get frame dimensions
-    height, width = frame.shape[:2]
-
-    # Calculate frame bounds
-    y1 = max(0, cursor_y - cursor_half)
-    y2 = min(height, cursor_y + cursor_half)
-    x1 = max(0, cursor_x - cursor_half)
-    x2 = min(width, cursor_x + cursor_half)
-
-    # Only draw cursor if it's at least partially visible
-    if y2 > y1 and x2 > x1:
-        # Calculate cursor region bounds
-        cy1 = max(0, cursor_half - (cursor_y - y1))
-        cy2 = min(pencil_cursor_size, cursor_half + (y2 - cursor_y))
-        cx1 = max(0, cursor_half - (cursor_x - x1))
-        cx2 = min(pencil_cursor_size, cursor_half + (x2 - cursor_x))
-
-        # Ensure regions are valid
-        if cy2 > cy1 and cx2 > cx1:
-            cursor_region = pencil_cursor[cy1:cy2, cx1:cx2]
-            frame_region_h = y2 - y1
-            frame_region_w = x2 - x1
-
-            # Double check dimensions match
-            if cursor_region.shape[0] == frame_region_h and cursor_region.shape[1] == frame_region_w:
-                alpha = (cursor_region[:, :, 3:] / 255.0) * alpha_multiplier
-                for c in range(3):
-                    frame[y1:y2, x1:x2, c] = (
-                        alpha[:, :, 0] * cursor_region[:, :, c] +
-                        (1 - alpha[:, :, 0]) * frame[y1:y2, x1:x2, c]
-                    )
+
+def _draw_cursor_on_frame(frame, cursor_layers, bounds, workspace=None):
+    """Draw cursor on frame with alpha blending
+
+    Args:
+        frame: Frame to draw on (modified in place)
+        cursor_layers: (premultiplied BGR, inverse alpha) uint8 pair from cursor_blend_layers
+        bounds: (y1, y2, x1, x2, cy1, cy2, cx1, cx2) row from _cursor_blit_bounds
+        workspace: Optional uint8 scratch buffer of the cursor's shape (allocated per call if None)
+    """
+    y1, y2, x1, x2, cy1, cy2, cx1, cx2 = bounds.tolist()
+    if y2 <= y1:
+        return
+
+    cursor_premul, inv_alpha = cursor_layers
+    if workspace is None:
+        workspace = np.empty_like(cursor_premul)
+    scratch = workspace[:y2 - y1, :x2 - x1]
+    frame_region = frame[y1:y2, x1:x2]
+
+    # frame = premul + inv_alpha * frame / 255, saturating uint8 SIMD ops
+    cv2.multiply(frame_region, inv_alpha[cy1:cy2, cx1:cx2], dst=scratch, scale=1.0 / 255)
+    cv2.add(cursor_premul[cy1:cy2, cx1:cx2], scratch, dst=frame_region)
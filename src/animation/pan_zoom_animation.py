@@ -4,23 +4,26 @@ import numpy as np
 import cv2
 # Relative import for grouped structure
 from ..config.config import FPS, DEFAULT_ZOOM_LEVEL, DEFAULT_PAN_DISTANCE_RATIO, DEFAULT_PAN_DIRECTION
+from ..image.image_utils import ensure_bgr_uint8
 
 
 def create_pan_zoom_animation(image, width, height, duration_seconds, direction=None, 
-                              zoom_level=None, pan_distance_ratio=None):
+                              zoom_level=None, pan_distance_ratio=None, interpolation=None):
     """Create frames for pan-zoom animation (vertical or horizontal)
 
     Args:
-        image: The image to animate (numpy.ndarray, already fitted to canvas with letterboxing)
+        image: The image to animate (numpy.ndarray, BGR uint8, already fitted to canvas with letterboxing)
         width: Video width in pixels
         height: Video height in pixels
         duration_seconds: Duration of animation in seconds
         direction: "up", "down", "left", "right" (default from config). 
         zoom_level: Zoom factor (1.0 = no zoom, 1.1 = 10% zoom in). Default uses config.
         pan_distance_ratio: Pan distance as ratio of dimension (0.0-1.0). Default uses config.
+        interpolation: cv2 interpolation for the zoom resize (default: LINEAR up, AREA down)
 
     Returns:
-        list: List of frames (numpy.ndarray) for the animation
+        list: List of frames (numpy.ndarray) for the animation; read-only views into one
+        zoomed image, so copy a frame before drawing on it
     """
     if direction is None:
         direction = DEFAULT_PAN_DIRECTION
@@ -29,93 +32,45 @@ def create_pan_zoom_animation(image, width, height, duration_seconds, direction=
     if pan_distance_ratio is None:
         pan_distance_ratio = DEFAULT_PAN_DISTANCE_RATIO
 
-    frames = []
+    # Frames stay BGR end to end (ffmpeg reads bgr24)
+    ensure_bgr_uint8(image)
+
     img_height, img_width = image.shape[:2]
-    
-    # Calculate zoomed dimensions
-    zoomed_width = int(img_width * zoom_level)
-    zoomed_height = int(img_height * zoom_level)
-    
+    zoomed_width, zoomed_height, requested_pan_distance, pan_distance_pixels, max_available = \
+        _pan_zoom_geometry(img_width, img_height, width, height, direction, zoom_level, pan_distance_ratio)
+
     # Resize image with zoom
-    zoomed_image = cv2.resize(image, (zoomed_width, zoomed_height), 
-                              interpolation=cv2.INTER_LANCZOS4)
-    
-    # Center offsets
-    center_x = (zoomed_width - width) // 2
-    center_y = (zoomed_height - height) // 2
-    
-    # Available pan spaces for all directions
-    avail_up = center_y
-    avail_down = zoomed_height - height - center_y
-    avail_left = center_x
-    avail_right = zoomed_width - width - center_x
-    
-    # Requested distance: height for vert, width for horiz
-    if direction in ("up", "down"):
-        requested_pan_distance = int(height * pan_distance_ratio)
-        max_available = min(avail_up, avail_down)
-    else:  # left or right
-        requested_pan_distance = int(width * pan_distance_ratio)
-        max_available = min(avail_left, avail_right)
-    
-    pan_distance_pixels = min(requested_pan_distance, max_available)
-    
-    # Minimum movement if zero
-    if pan_distance_pixels == 0:
-        pan_distance_pixels = max(1, max_available)
-    
+    if interpolation is None:
+        interpolation = _zoom_interpolation(zoom_level)
+    zoomed_image = cv2.resize(image, (zoomed_width, zoomed_height), interpolation=interpolation)
+    # Frames are views into this buffer; read-only so in-place drawing can't bleed across frames
+    zoomed_image.flags.writeable = False
+
     # Note if reduced
     if pan_distance_pixels < requested_pan_distance:
         print(f"  Note: Pan distance reduced from {requested_pan_distance}px to {pan_distance_pixels}px "
               f"(avail: {max_available}px)")
-    
-    # Generate frames
+
+    # Crop origin for every frame, computed up front
     total_frames = int(duration_seconds * FPS)
-    
-    for frame_idx in range(total_frames):
-        # Calculate progress (0.0 to 1.0) - linear, no easing
-        if total_frames == 1:
-            progress = 0.0
-        else:
-            progress = frame_idx / (total_frames - 1)
-        
-        # Linear progress, calculate offset based on direction
-        if direction == "up":
-            offset_y = -pan_distance_pixels * (1 - progress)
-            offset_x = 0
-        elif direction == "down":
-            offset_y = pan_distance_pixels * (1 - progress)
-            offset_x = 0
-        elif direction == "left":
-            offset_x = -pan_distance_pixels * (1 - progress)
-            offset_y = 0
-        elif direction == "right":
-            offset_x = pan_distance_pixels * (1 - progress)
-            offset_y = 0
-        else:
-            offset_x = offset_y = 0
-        
-        # Crop region
-        crop_x = center_x + int(offset_x)
-        crop_y = center_y + int(offset_y)
-        
-        # Bounds check
-        crop_x = max(0, min(crop_x, zoomed_width - width))
-        crop_y = max(0, min(crop_y, zoomed_height - height))
-        
-        # Extract frame from zoomed image
-        frame = zoomed_image[crop_y:crop_y+height, crop_x:crop_x+width].copy()
-        
-        # Ensure frame is exactly the right size (handle edge cases)
-        if frame.shape[0] != height or frame.shape[1] != width:
-            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_LANCZOS4)
-        
+    crop_xs, crop_ys = _pan_crop_offsets(total_frames, zoomed_width, zoomed_height, width, height,
+                                         direction, pan_distance_pixels)
+
+    frames = []
+    for crop_x, crop_y in zip(crop_xs.tolist(), crop_ys.tolist()):
+        # Extract frame from zoomed image (view, no copy)
+        frame = zoomed_image[crop_y:crop_y+height, crop_x:crop_x+width]
+
+        # Ensure frame is exactly the right size
+        frame = _fit_frame(frame, width, height, interpolation)
+
         frames.append(frame)
 
     return frames
 
 
-def apply_pan_zoom_to_frames(frames, width, height, direction=None, zoom_level=None, pan_distance_ratio=None):
+def apply_pan_zoom_to_frames(frames, width, height, direction=None, zoom_level=None, pan_distance_ratio=None,
+                             interpolation=None):
     """Apply the same pan-zoom animation to each frame in a list (e.g. from a video clip).
 
     Each input frame is zoomed and cropped with the same progression as create_pan_zoom_animation,
@@ -128,6 +83,7 @@ def apply_pan_zoom_to_frames(frames, width, height, direction=None, zoom_level=N
         direction: "up", "down", "left", "right"
         zoom_level: Zoom factor (e.g. 1.1)
         pan_distance_ratio: Pan distance as ratio of dimension
+        interpolation: cv2 interpolation for the per-frame zoom (default: LINEAR up, AREA down)
 
     Returns:
         list: List of BGR frames with pan-zoom applied
@@ -144,56 +100,113 @@ def apply_pan_zoom_to_frames(frames, width, height, direction=None, zoom_level=N
 
     total_frames = len(frames)
     img_height, img_width = frames[0].shape[:2]
+    zoomed_width, zoomed_height, _, pan_distance_pixels, _ = \
+        _pan_zoom_geometry(img_width, img_height, width, height, direction, zoom_level, pan_distance_ratio)
+    crop_xs, crop_ys = _pan_crop_offsets(total_frames, zoomed_width, zoomed_height, width, height,
+                                         direction, pan_distance_pixels)
+
+    if interpolation is None:
+        interpolation = _zoom_interpolation(zoom_level)
+
+    out_frames = []
+    for frame, crop_x, crop_y in zip(frames, crop_xs.tolist(), crop_ys.tolist()):
+        zoomed = cv2.resize(frame, (zoomed_width, zoomed_height), interpolation=interpolation)
+        frame = zoomed[crop_y : crop_y + height, crop_x : crop_x + width].copy()
+        frame = _fit_frame(frame, width, height, interpolation)
+        out_frames.append(frame)
+
+    return out_frames
+
+
+def _fit_frame(frame, width, height, interpolation):
+    """Resize a cropped frame to exactly width x height
+
+    Rounding leaves normal crops at most a pixel short, which INTER_NEAREST fixes
+    cheaply. A zoom_level below 1 makes the zoomed image smaller than the canvas,
+    so that real upscale uses the zoom interpolation instead.
+
+    Args:
+        frame: Cropped BGR frame
+        width: Target width
+        height: Target height
+        interpolation: cv2 interpolation used for the zoom resize
+
+    Returns:
+        numpy.ndarray: Frame of shape (height, width, 3) (frame itself if already that size)
+    """
+    frame_height, frame_width = frame.shape[:2]
+    if frame_height == height and frame_width == width:
+        return frame
+    if abs(frame_height - height) <= 1 and abs(frame_width - width) <= 1:
+        interpolation = cv2.INTER_NEAREST
+    elif interpolation == cv2.INTER_AREA and (frame_height < height or frame_width < width):
+        # INTER_AREA degrades to nearest-neighbour when enlarging
+        interpolation = cv2.INTER_LINEAR
+    return cv2.resize(frame, (width, height), interpolation=interpolation)
+
+
+def _pan_zoom_geometry(img_width, img_height, width, height, direction, zoom_level, pan_distance_ratio):
+    """Zoomed size and pan distance shared by image and video pan-zoom
+
+    Returns:
+        tuple: (zoomed_width, zoomed_height, requested_pan_distance, pan_distance_pixels, max_available)
+    """
+    # Calculate zoomed dimensions
     zoomed_width = int(img_width * zoom_level)
     zoomed_height = int(img_height * zoom_level)
+
+    # Center offsets
     center_x = (zoomed_width - width) // 2
     center_y = (zoomed_height - height) // 2
-    avail_up = center_y
-    avail_down = zoomed_height - height - center_y
-    avail_left = center_x
-    avail_right = zoomed_width - width - center_x
 
+    # Requested distance: height for vert, width for horiz; limited by space on both sides
     if direction in ("up", "down"):
         requested_pan_distance = int(height * pan_distance_ratio)
-        max_available = min(avail_up, avail_down)
-    else:
+        max_available = min(center_y, zoomed_height - height - center_y)
+    else:  # left or right
         requested_pan_distance = int(width * pan_distance_ratio)
-        max_available = min(avail_left, avail_right)
+        max_available = min(center_x, zoomed_width - width - center_x)
+
     pan_distance_pixels = min(requested_pan_distance, max_available)
+
+    # Minimum movement if zero
     if pan_distance_pixels == 0:
         pan_distance_pixels = max(1, max_available)
 
-    out_frames = []
-    for frame_idx in range(total_frames):
-        if total_frames == 1:
-            progress = 0.0
-        else:
-            progress = frame_idx / (total_frames - 1)
-
-        if direction == "up":
-            offset_y = -pan_distance_pixels * (1 - progress)
-            offset_x = 0
-        elif direction == "down":
-            offset_y = pan_distance_pixels * (1 - progress)
-            offset_x = 0
-        elif direction == "left":
-            offset_x = -pan_distance_pixels * (1 - progress)
-            offset_y = 0
-        elif direction == "right":
-            offset_x = pan_distance_pixels * (1 - progress)
-            offset_y = 0
-        else:
-            offset_x = offset_y = 0
-
-        crop_x = center_x + int(offset_x)
-        crop_y = center_y + int(offset_y)
-        crop_x = max(0, min(crop_x, zoomed_width - width))
-        crop_y = max(0, min(crop_y, zoomed_height - height))
-
-        zoomed = cv2.resize(frames[frame_idx], (zoomed_width, zoomed_height), interpolation=cv2.INTER_LANCZOS4)
-        frame = zoomed[crop_y : crop_y + height, crop_x : crop_x + width].copy()
-        if frame.shape[0] != height or frame.shape[1] != width:
-            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_LANCZOS4)
-        out_frames.append(frame)
+    return zoomed_width, zoomed_height, requested_pan_distance, pan_distance_pixels, max_available
 
-    return out_frames
+
+def _pan_crop_offsets(total_frames, zoomed_width, zoomed_height, width, height, direction, pan_distance_pixels):
+    """Per-frame crop origins for a linear pan (vectorized over all frames)
+
+    Returns:
+        tuple: (crop_xs, crop_ys) int arrays of length total_frames
+    """
+    # Linear progress 0.0 -> 1.0, no easing
+    if total_frames > 1:
+        progress = np.arange(total_frames) / (total_frames - 1)
+    else:
+        progress = np.zeros(total_frames)
+    remaining = pan_distance_pixels * (1 - progress)
+
+    # Offset toward the start side, truncated like int()
+    offset_x = np.zeros(total_frames, dtype=np.int64)
+    offset_y = np.zeros(total_frames, dtype=np.int64)
+    if direction == "up":
+        offset_y = (-remaining).astype(np.int64)
+    elif direction == "down":
+        offset_y = remaining.astype(np.int64)
+    elif direction == "left":
+        offset_x = (-remaining).astype(np.int64)
+    elif direction == "right":
+        offset_x = remaining.astype(np.int64)
+
+    # Bounds check (lower bound last: a zoomed image smaller than the canvas crops from 0)
+    crop_xs = np.maximum(np.minimum((zoomed_width - width) // 2 + offset_x, zoomed_width - width), 0)
+    crop_ys = np.maximum(np.minimum((zoomed_height - height) // 2 + offset_y, zoomed_height - height), 0)
+    return crop_xs, crop_ys
+
+
+def _zoom_interpolation(zoom_level):
+    """Cheap resize filter for the zoom (Lanczos is overkill for output viewed compressed)"""
+    return cv2.INTER_LINEAR if zoom_level >= 1.0 else cv2.INTER_AREA
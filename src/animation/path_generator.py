@@ -1,7 +1,12 @@
 """Path generation utilities for cursor movement"""
 
+from functools import lru_cache
+
 import numpy as np
 
+# Fractional bits of the reveal projection axis; keeps projections exact in float32
+_PROJECTION_BITS = 8
+
 
 def generate_diagonal_zigzag_path(width, height, amplitude, angle_deg, reveal_duration, fps):
     """Generate zig-zag path from top-left to bottom-right at specified angle with human-like movement
@@ -15,10 +20,9 @@ def generate_diagonal_zigzag_path(width, height, amplitude, angle_deg, reveal_du
         fps: Frames per second
 
     Returns:
-        list: List of (x, y) tuples representing cursor positions for each frame
+        numpy.ndarray: (N, 2) int32 array of (x, y) cursor positions, one row per frame
     """
     total_frames = int(reveal_duration * fps)
-    path = []
 
     # Convert angle to radians
     angle_rad = np.radians(angle_deg)
@@ -35,85 +39,163 @@ def generate_diagonal_zigzag_path(width, height, amplitude, angle_deg, reveal_du
     start_x = -200
     start_y = -200
 
+    # Size-independent timing terms (progress, amplitude variations, sine table) are cached per length
+    frequency = 4  # number of complete zig-zags
+    progress, amplitude_variations, zig_sine = _zigzag_profile(total_frames, frequency)
+
+    # Position along the diagonal
+    dist_along_diagonal = progress * diagonal_length
+    base_x = start_x + dist_along_diagonal * dx
+    base_y = start_y + dist_along_diagonal * dy
+
+    # Zig-zag perpendicular to the diagonal (rotate 90 degrees) with smooth amplitude variation
+    perp_x = -dy
+    perp_y = dx
+    zig_offset = amplitude * amplitude_variations * zig_sine
+
+    # Final positions (don't clamp - let cursor move off-screen naturally)
+    path = np.empty((total_frames, 2), dtype=np.int32)
+    path[:, 0] = base_x + zig_offset * perp_x
+    path[:, 1] = base_y + zig_offset * perp_y
+
+    return path
+
+
+@lru_cache(maxsize=16)
+def _zigzag_profile(total_frames, frequency):
+    """Per-frame timing terms of the zig-zag path, which depend only on its length
+
+    Args:
+        total_frames: Number of path frames
+        frequency: Number of complete zig-zags
+
+    Returns:
+        tuple: Read-only (progress, amplitude_variations, sine) float64 arrays of length total_frames
+    """
     # Pre-generate smooth amplitude variations
-    np.random.seed(42)  # For reproducible smooth randomness
-    amplitude_variations = np.random.uniform(0.8, 1.2, total_frames)
+    # Private seeded generator: reproducible (same stream as np.random.seed(42)) without touching global state
+    rng = np.random.RandomState(42)
+    amplitude_variations = rng.uniform(0.8, 1.2, total_frames)
     # Smooth out variations with moving average
-    window = 15
-    amplitude_variations = np.convolve(amplitude_variations, np.ones(window)/window, mode='same')
+    amplitude_variations = _moving_average_same(amplitude_variations, 15)
 
-    for frame in range(total_frames):
-        # Linear progress
-        linear_progress = frame / total_frames
+    # Linear progress with ease-in-out (smoothstep) for natural acceleration/deceleration
+    linear_progress = np.arange(total_frames) / total_frames
+    progress = linear_progress * linear_progress * (3 - 2 * linear_progress)
 
-        # Apply ease-in-out for natural acceleration/deceleration
-        # Smooth S-curve (smoothstep function)
-        progress = linear_progress * linear_progress * (3 - 2 * linear_progress)
+    # Oscillator sampled once per frame
+    sine = np.sin(frequency * progress * 2 * np.pi)
 
-        # Position along the diagonal
-        dist_along_diagonal = progress * diagonal_length
-        base_x = start_x + dist_along_diagonal * dx
-        base_y = start_y + dist_along_diagonal * dy
+    for table in (progress, amplitude_variations, sine):
+        table.flags.writeable = False
+    return progress, amplitude_variations, sine
 
-        # Add zig-zag perpendicular to the diagonal
-        # Perpendicular vector (rotate 90 degrees)
-        perp_x = -dy
-        perp_y = dx
 
-        # Zig-zag with multiple oscillations and smooth variation
-        frequency = 4  # number of complete zig-zags
+def _moving_average_same(values, window):
+    """Centered moving average with zero padding, matching np.convolve(..., mode='same')
 
-        # Use pre-generated smooth amplitude variation
-        amplitude_variation = amplitude * amplitude_variations[frame]
-        zig_offset = amplitude_variation * np.sin(frequency * progress * 2 * np.pi)
+    Uses a cumulative sum, so cost is O(N) regardless of window.
 
-        # Calculate base position with zig-zag
-        pos_x = base_x + zig_offset * perp_x
-        pos_y = base_y + zig_offset * perp_y
+    Args:
+        values: 1D array
+        window: Odd window length
 
-        # Final position (don't clamp - let cursor move off-screen naturally)
-        x = int(pos_x)
-        y = int(pos_y)
+    Returns:
+        numpy.ndarray: Smoothed array, same length as values
+    """
+    half = window // 2
+    padded = np.zeros(len(values) + 2 * half + 1)
+    np.cumsum(values, out=padded[half + 1:len(values) + half + 1])
+    padded[len(values) + half + 1:] = padded[len(values) + half]
+    return (padded[window:window + len(values)] - padded[:len(values)]) / window
 
-        path.append((x, y))
 
-    return path
+@lru_cache(maxsize=2)
+def create_reveal_projection(width, height, angle_deg):
+    """Project every pixel onto the diagonal direction
 
-
-def create_diagonal_reveal_mask(width, height, cursor_x, cursor_y, angle_deg):
-    """Create a mask for revealing the image along a diagonal line
+    The reveal mask for a cursor at (cx, cy) is simply
+    ``projection <= reveal_thresholds(...)``, so only a scalar changes per frame.
+    Cached per frame size, so every clip of a multi-image render shares one field;
+    the returned array is shared and read-only.
 
     Args:
         width: Canvas width in pixels
         height: Canvas height in pixels
-        cursor_x: Current cursor X position
-        cursor_y: Current cursor Y position
         angle_deg: Diagonal angle in degrees from horizontal
 
     Returns:
-        numpy.ndarray: Binary mask (255 = revealed, 0 = hidden)
+        numpy.ndarray: (height, width) float32 projection field
     """
-    # Convert angle to radians
-    angle_rad = np.radians(angle_deg)
+    cos_a, sin_a = _projection_axis(angle_deg)
+    x_proj = np.arange(width, dtype=np.float32) * np.float32(cos_a)
+    y_proj = np.arange(height, dtype=np.float32) * np.float32(sin_a)
+    projection = y_proj[:, np.newaxis] + x_proj[np.newaxis, :]
+    projection.flags.writeable = False
+    return projection
 
-    # Create coordinate grids
-    x_coords = np.arange(width)
-    y_coords = np.arange(height)
-    xx, yy = np.meshgrid(x_coords, y_coords)
 
-    # Vector from cursor to each point
-    vx = xx - cursor_x
-    vy = yy - cursor_y
+def reveal_thresholds(path, angle_deg):
+    """Per-frame projection thresholds for cursor positions along a path
+
+    Args:
+        path: (N, 2) array of cursor (x, y) positions
+        angle_deg: Diagonal angle in degrees from horizontal
+
+    Returns:
+        numpy.ndarray: (N,) float32 thresholds (pixels with projection <= threshold are revealed)
+    """
+    cos_a, sin_a = _projection_axis(angle_deg)
+    return (path[:, 0] * cos_a + path[:, 1] * sin_a).astype(np.float32)
 
-    # Diagonal direction vector
-    dx = np.cos(angle_rad)
-    dy = np.sin(angle_rad)
 
-    # Project onto diagonal direction
-    # If negative, point is behind the cursor (should be revealed)
-    projection = vx * dx + vy * dy
+def _projection_axis(angle_deg):
+    """Diagonal direction snapped to multiples of 2**-_PROJECTION_BITS
 
-    # Create mask
-    mask = (projection <= 0).astype(np.uint8) * 255
+    Pixel and cursor projections are then sums of exactly representable products,
+    so the field and the thresholds agree bit for bit and pixels on the reveal
+    line compare equal instead of flipping with rounding.
 
-    return mask
+    Args:
+        angle_deg: Diagonal angle in degrees from horizontal
+
+    Returns:
+        tuple: (cos, sin) floats
+    """
+    scale = 1 << _PROJECTION_BITS
+    angle_rad = np.radians(angle_deg)
+    return round(np.cos(angle_rad) * scale) / scale, round(np.sin(angle_rad) * scale) / scale
+
+
+def reveal_band_rows(lower, upper, width, height, angle_deg):
+    """Rows that can hold projection values in (lower, upper]
+
+    Used to limit per-frame work to the strip swept since the previous frame.
+    The range is conservative by one row on each side.
+
+    Args:
+        lower: Previous frame's threshold (exclusive)
+        upper: Current frame's threshold (inclusive)
+        width: Canvas width in pixels
+        height: Canvas height in pixels
+        angle_deg: Diagonal angle in degrees from horizontal
+
+    Returns:
+        tuple: (row_start, row_end) half-open row range, possibly empty
+    """
+    cos_a, sin_a = _projection_axis(angle_deg)
+    if sin_a == 0:
+        return 0, height
+
+    # Each row spans projections y*sin + [off_min, off_max]
+    x_span = (width - 1) * cos_a
+    off_min, off_max = min(0.0, x_span), max(0.0, x_span)
+    if sin_a > 0:
+        row_start = np.floor((lower - off_max) / sin_a)
+        row_end = np.floor((upper - off_min) / sin_a) + 2
+    else:
+        row_start = np.floor((upper - off_min) / sin_a)
+        row_end = np.ceil((lower - off_max) / sin_a) + 2
+    row_start = int(min(max(row_start, 0), height))
+    row_end = int(min(max(row_end, row_start), height))
+    return row_start, row_end
@@ -1,10 +1,73 @@
 """Audio processing utilities for adding background music to videos"""
 
+import mmap
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Colored logging for differentiation
-from ..utils.log_utils import log_success
+from ..utils.log_utils import log_success, log_warning
+# Relative import for grouped structure
+from ..config.config import TEMP_DIR, get_x264_preset
+
+# Hardware H.264 encoders in preference order, with roughly crf-23-equivalent quality settings
+HARDWARE_H264_ENCODERS = (
+    ('h264_videotoolbox', ['-q:v', '65']),
+    ('h264_nvenc', ['-preset', 'p4', '-cq', '23']),
+    ('h264_qsv', ['-global_quality', '23']),
+)
+SOFTWARE_H264_ARGS = ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23', '-threads', '0']
+
+# Background ffprobe workers (created on first use)
+_probe_executor = None
+# ffmpeg stderr lines kept for error messages
+FFMPEG_STDERR_TAIL_LINES = 64
+# Audio formats that can be stream-copied into an MP4 without re-encoding
+MP4_COPYABLE_AUDIO_SUFFIXES = {'.aac', '.m4a', '.mp3', '.mp4'}
+
+
+def _run_ffmpeg(cmd):
+    """Run an ffmpeg command, keeping only the tail of its stderr
+
+    stderr is drained while ffmpeg runs (so it never blocks on a full pipe)
+    into a bounded buffer; stdout is discarded.
+
+    Args:
+        cmd: ffmpeg argument list (starting with 'ffmpeg')
+
+    Raises:
+        subprocess.CalledProcessError: On non-zero exit, with the stderr tail as .stderr
+        FileNotFoundError: If ffmpeg is not installed
+    """
+    cmd = [cmd[0], '-hide_banner', '-loglevel', 'error', *cmd[1:]]
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          text=True, errors='replace') as proc:
+        stderr_tail = deque(proc.stderr, maxlen=FFMPEG_STDERR_TAIL_LINES)
+        returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=''.join(stderr_tail))
+
+
+def _audio_codec_args(audio_path, audio_filter):
+    """ffmpeg audio arguments: stream copy when nothing needs filtering, else filter + encode
+
+    Args:
+        audio_path: Path to the audio input
+        audio_filter: Audio filter string, or None when the audio is used as-is
+
+    Returns:
+        list: ffmpeg audio arguments
+    """
+    if audio_filter is None and Path(audio_path).suffix.lower() in MP4_COPYABLE_AUDIO_SUFFIXES:
+        return ['-c:a', 'copy']
+    return ['-filter:a', audio_filter or 'anull']
+
+
+def _volume_filter(volume):
+    """Volume filter string, or None at unity gain"""
+    return None if volume == 1.0 else f'volume={volume}'
 
 
 def add_background_music(video_path, audio_path, output_path=None, volume=1.0):
@@ -43,25 +106,21 @@ def add_background_music(video_path, audio_path, output_path=None, volume=1.0):
     try:
         # FFmpeg command to add audio to video
         # -shortest: finish encoding when shortest input stream ends
-        # -filter:a: audio filter for volume adjustment
+        # -filter:a: audio filter for volume adjustment (stream copy when volume is 1.0)
         cmd = [
             'ffmpeg', '-y',
             '-i', str(video_path),      # Input video
             '-i', str(audio_path),      # Input audio
             '-c:v', 'copy',             # Copy video codec (no re-encode)
-            '-filter:a', f'volume={volume}',  # Adjust volume
+            *_audio_codec_args(audio_path, _volume_filter(volume)),  # Adjust volume (copy at 1.0)
             '-shortest',                # Match video duration
             '-map', '0:v:0',           # Map video from first input
             '-map', '1:a:0',           # Map audio from second input
+            '-movflags', '+faststart',
             str(output_path)
         ]
 
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        _run_ffmpeg(cmd)
 
         log_success(f"✓ Background music added: {output_path}")
         return output_path
@@ -78,9 +137,44 @@ def add_background_music(video_path, audio_path, output_path=None, volume=1.0):
         )
 
 
+@lru_cache(maxsize=1)
+def get_h264_encoder_args():
+    """Pick ffmpeg H.264 encoder arguments, preferring a working hardware encoder
+
+    Each candidate is test-encoded on a tiny synthetic clip (being listed by
+    ``ffmpeg -encoders`` does not mean the device is present). Probed once per process.
+
+    Returns:
+        list: ffmpeg arguments starting with -c:v
+    """
+    try:
+        listed = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            check=True, capture_output=True, text=True
+        ).stdout
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return list(SOFTWARE_H264_ARGS)
+
+    for encoder, quality_args in HARDWARE_H264_ENCODERS:
+        if encoder not in listed:
+            continue
+        args = ['-c:v', encoder] + quality_args
+        probe_cmd = [
+            'ffmpeg', '-hide_banner', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', 'color=c=white:s=256x256:d=0.1',
+            '-frames:v', '1', *args, '-pix_fmt', 'yuv420p', '-f', 'null', '-'
+        ]
+        if subprocess.run(probe_cmd, capture_output=True).returncode == 0:
+            return args
+    return list(SOFTWARE_H264_ARGS)
+
+
 def get_media_duration(media_path):
     """Get duration of a media file (video or audio) using ffprobe
 
+    Results are cached per (path, mtime, size), so re-probing an unchanged file
+    does not spawn another ffprobe.
+
     Args:
         media_path: Path to media file
 
@@ -88,12 +182,39 @@ def get_media_duration(media_path):
         float: Duration in seconds
     """
     media_path = Path(media_path)
+    try:
+        stat = media_path.stat()
+    except OSError as e:
+        raise ValueError(f"Failed to get media duration: {e}")
+    return _get_media_duration_cached(str(media_path), stat.st_mtime_ns, stat.st_size)
+
+
+def prefetch_media_duration(media_path):
+    """Start probing a media file's duration in the background
 
+    The result lands in get_media_duration's cache, so a later call returns
+    without waiting on ffprobe (errors resurface from that call).
+
+    Args:
+        media_path: Path to media file
+
+    Returns:
+        concurrent.futures.Future: Future resolving to the duration in seconds
+    """
+    global _probe_executor
+    if _probe_executor is None:
+        _probe_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ffprobe')
+    return _probe_executor.submit(get_media_duration, media_path)
+
+
+@lru_cache(maxsize=128)
+def _get_media_duration_cached(media_path, mtime_ns, size):
+    """ffprobe a media file's duration (mtime_ns/size only key the cache)"""
     probe_cmd = [
         'ffprobe', '-v', 'error',
         '-show_entries', 'format=duration',
         '-of', 'default=noprint_wrappers=1:nokey=1',
-        str(media_path)
+        media_path
     ]
 
     try:
@@ -110,6 +231,95 @@ def get_media_duration(media_path):
         raise FileNotFoundError("ffprobe not found. Please install ffmpeg")
 
 
+def get_video_stream_info(video_path):
+    """Get width, height and frame rate of a video's first stream using ffprobe
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        tuple: (width, height, frame_rate) with frame_rate as an ffmpeg rational (e.g. "30/1")
+    """
+    probe_cmd = [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'stream=width,height,r_frame_rate',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        str(video_path)
+    ]
+
+    try:
+        probe_result = subprocess.run(
+            probe_cmd,
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        width, height, frame_rate = probe_result.stdout.split()
+        return int(width), int(height), frame_rate
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"Failed to get video stream info: {e.stderr}")
+    except FileNotFoundError:
+        raise FileNotFoundError("ffprobe not found. Please install ffmpeg")
+
+
+def _read_avcc(video_path):
+    """Return the H.264 decoder configuration (avcC box) of an MP4, or None if absent"""
+    with open(video_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        idx = data.find(b'avcC')
+        if idx < 4:
+            return None
+        size = int.from_bytes(data[idx - 4:idx], 'big')
+        return bytes(data[idx - 4:idx - 4 + size])
+
+
+def _extend_video_tail(video_path, extra_time, temp_paths):
+    """Append extra_time seconds of the last frame, encoding only the new tail
+
+    The tail is encoded with this project's x264 settings for the video's height,
+    so for videos rendered here its parameter sets match and the concat demuxer
+    can stream-copy both parts.
+
+    Args:
+        video_path: Path to the MP4 video to extend
+        extra_time: Seconds to append
+        temp_paths: List that receives every temp file created (caller deletes them)
+
+    Returns:
+        Path: Concat demuxer list describing the extended video
+
+    Raises:
+        ValueError: If the tail can't be stream-copied after the video (different encoder settings)
+        subprocess.CalledProcessError: If an ffmpeg step fails
+    """
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    last_frame = TEMP_DIR / f"{video_path.stem}_last.png"
+    tail_path = TEMP_DIR / f"{video_path.stem}_tail.mp4"
+    list_path = TEMP_DIR / f"{video_path.stem}_extend.txt"
+    temp_paths.extend([last_frame, tail_path, list_path])
+
+    _, height, frame_rate = get_video_stream_info(video_path)
+    steps = [
+        # Last frame: decode only the final second, keep overwriting the still
+        ['ffmpeg', '-y', '-sseof', '-1', '-i', str(video_path),
+         '-update', '1', str(last_frame)],
+        # Still tail at the same frame rate and encoder settings
+        ['ffmpeg', '-y', '-loop', '1', '-framerate', frame_rate, '-i', str(last_frame),
+         '-t', f'{extra_time:.3f}',
+         '-c:v', 'libx264', '-preset', get_x264_preset(height), '-crf', '23',
+         '-tune', 'stillimage', '-threads', '0', '-pix_fmt', 'yuv420p', str(tail_path)],
+    ]
+    for step in steps:
+        _run_ffmpeg(step)
+
+    source_config = _read_avcc(video_path)
+    if source_config is None or source_config != _read_avcc(tail_path):
+        raise ValueError("video was not encoded with matching x264 settings")
+
+    list_path.write_text(f"file '{video_path.resolve()}'\nfile '{tail_path.resolve()}'\n")
+    return list_path
+
+
 def loop_audio_to_video_length(video_path, audio_path, output_path=None, volume=1.0, fadeout_duration=1.0):
     """Add background music that loops to match video duration with smooth fadeout
 
@@ -149,7 +359,10 @@ def loop_audio_to_video_length(video_path, audio_path, output_path=None, volume=
 
         # FFmpeg command with audio looping and fadeout
         # afade: audio fadeout filter starting at video_duration - fadeout_duration
-        audio_filter = f'volume={volume},afade=t=out:st={fadeout_start}:d={fadeout_duration}'
+        audio_filters = [f'volume={volume}'] if volume != 1.0 else []
+        if fadeout_duration > 0:
+            audio_filters.append(f'afade=t=out:st={fadeout_start}:d={fadeout_duration}')
+        audio_filter = ','.join(audio_filters) or None
 
         cmd = [
             'ffmpeg', '-y',
@@ -157,19 +370,15 @@ def loop_audio_to_video_length(video_path, audio_path, output_path=None, volume=
             '-stream_loop', '-1',       # Loop audio infinitely
             '-i', str(audio_path),
             '-c:v', 'copy',
-            '-filter:a', audio_filter,
+            *_audio_codec_args(audio_path, audio_filter),
             '-shortest',                # Stop when video ends
             '-map', '0:v:0',
             '-map', '1:a:0',
+            '-movflags', '+faststart',
             str(output_path)
         ]
 
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        _run_ffmpeg(cmd)
 
         log_success(f"✓ Looped background music added with fadeout: {output_path}")
         return output_path
@@ -215,10 +424,13 @@ def match_video_to_audio_length(video_path, audio_path, output_path=None, volume
     print(f"\nAdding background music: {audio_path.name}")
     print(f"Volume level: {volume}")
 
+    temp_paths = []
+    extended_list = None
     try:
-        # Get durations
-        video_duration = get_media_duration(video_path)
+        # Get durations (both ffprobes run concurrently)
+        video_duration_future = prefetch_media_duration(video_path)
         audio_duration = get_media_duration(audio_path)
+        video_duration = video_duration_future.result()
 
         print(f"Video duration: {video_duration:.2f}s")
         print(f"Audio duration: {audio_duration:.2f}s")
@@ -228,7 +440,30 @@ def match_video_to_audio_length(video_path, audio_path, output_path=None, volume
             extra_time = audio_duration - video_duration
             print(f"Extending video by {extra_time:.2f}s to match audio duration")
 
-            # Use tpad filter to extend video by duplicating last frame
+            # Encode only the appended tail and stream-copy the rest
+            try:
+                extended_list = _extend_video_tail(video_path, extra_time, temp_paths)
+            except (subprocess.CalledProcessError, ValueError) as e:
+                detail = (getattr(e, 'stderr', None) or str(e)).strip()[-200:]
+                log_warning(f"Tail-only extend unavailable, re-encoding full video: {detail}")
+
+        if extended_list is not None:
+            cmd = [
+                'ffmpeg', '-y',
+                '-f', 'concat', '-safe', '0',
+                '-i', str(extended_list),
+                '-stream_loop', '-1',       # Loop audio infinitely
+                '-i', str(audio_path),
+                '-c:v', 'copy',
+                *_audio_codec_args(audio_path, _volume_filter(volume)),
+                '-shortest',                # Stop when audio ends (now longer than video)
+                '-map', '0:v:0',
+                '-map', '1:a:0',
+                '-movflags', '+faststart',
+                str(output_path)
+            ]
+        elif audio_duration > video_duration:
+            # Fallback: tpad filter extends video by duplicating last frame (full re-encode)
             cmd = [
                 'ffmpeg', '-y',
                 '-i', str(video_path),
@@ -237,11 +472,11 @@ def match_video_to_audio_length(video_path, audio_path, output_path=None, volume
                 '-filter_complex', f'[0:v]tpad=stop_mode=clone:stop_duration={extra_time}[v]',
                 '-map', '[v]',
                 '-map', '1:a:0',
-                '-filter:a', f'volume={volume}',
+                *_audio_codec_args(audio_path, _volume_filter(volume)),
                 '-shortest',                # Stop when audio ends (now longer than video)
-                '-c:v', 'libx264',          # Re-encode video to extend it
-                '-preset', 'medium',
-                '-crf', '23',
+                *get_h264_encoder_args(),   # Re-encode video to extend it (hardware when available)
+                '-pix_fmt', 'yuv420p',
+                '-movflags', '+faststart',
                 str(output_path)
             ]
         else:
@@ -252,19 +487,15 @@ def match_video_to_audio_length(video_path, audio_path, output_path=None, volume
                 '-stream_loop', '-1',       # Loop audio infinitely
                 '-i', str(audio_path),
                 '-c:v', 'copy',
-                '-filter:a', f'volume={volume}',
+                *_audio_codec_args(audio_path, _volume_filter(volume)),
                 '-shortest',                # Stop when video ends
                 '-map', '0:v:0',
                 '-map', '1:a:0',
+                '-movflags', '+faststart',
                 str(output_path)
             ]
 
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        _run_ffmpeg(cmd)
 
         log_success(f"✓ Audio added successfully: {output_path}")
         return output_path
@@ -276,6 +507,9 @@ def match_video_to_audio_length(video_path, audio_path, output_path=None, volume
         raise FileNotFoundError(
             "ffmpeg not found. Please install ffmpeg"
         )
+    finally:
+        for path in temp_paths:
+            path.unlink(missing_ok=True)
 
 
 def get_terminal_command(video_path, audio_path, output_path=None, loop=False, volume=1.0):
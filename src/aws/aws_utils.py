@@ -1,11 +1,14 @@
 """AWS S3 upload utilities"""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Colored logging for differentiation
 from ..utils.log_utils import log_success
+# Relative import for grouped structure
+from ..config.config import S3_MULTIPART_THRESHOLD, S3_MULTIPART_CHUNKSIZE, S3_MAX_CONCURRENCY
 
 # Load environment variables from .env file
 load_dotenv()
@@ -26,7 +29,7 @@ def upload_to_s3(file_path, custom_name=None):
         ImportError: If boto3 is not installed
     """
     try:
-        import boto3
+        from boto3.s3.transfer import TransferConfig
         from botocore.exceptions import ClientError, NoCredentialsError
     except ImportError:
         raise ImportError(
@@ -75,20 +78,22 @@ def upload_to_s3(file_path, custom_name=None):
     print(f"  File: {object_name}")
 
     try:
-        # Create S3 client
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region
+        # Reuse the client (and its connection pool) across uploads in this process
+        s3_client = _get_s3_client(access_key, secret_key, region)
+
+        # Upload file (multipart with parallel parts for large videos)
+        transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=S3_MAX_CONCURRENCY,
+            use_threads=True
         )
-
-        # Upload file
         s3_client.upload_file(
             str(file_path),
             bucket_name,
             object_name,
-            ExtraArgs={'ContentType': 'video/mp4'}
+            ExtraArgs={'ContentType': 'video/mp4'},
+            Config=transfer_config
         )
 
         # Generate public URL
@@ -109,6 +114,28 @@ def upload_to_s3(file_path, custom_name=None):
             raise ValueError(f"S3 upload failed: {e}")
 
 
+@lru_cache(maxsize=1)
+def _get_s3_client(access_key, secret_key, region):
+    """Create an S3 client, cached per credentials/region
+
+    Args:
+        access_key: AWS access key ID
+        secret_key: AWS secret access key
+        region: AWS region name
+
+    Returns:
+        botocore.client.S3: S3 client
+    """
+    import boto3
+
+    return boto3.client(
+        's3',
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region
+    )
+
+
 def check_aws_credentials():
     """Check if AWS credentials are configured
 
@@ -6,18 +6,28 @@ Each frame shows the current word (per timing); optional pop-scale on appear +
 highlighted_words array (with custom color) from captions JSON config.
 """
 
-import json
+import os
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any, Union
+from typing import List, Tuple, Optional, Dict, Any, Union, Iterable, Iterator, FrozenSet, NamedTuple
 
-import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 # Relative import for grouped structure
 from ..config.config import PROJECT_ROOT
+from ..utils.json_utils import load_json_file_cached
 
 
+# Frames whose caption segment and pop scale are planned per batch when streaming
+CAPTION_PLAN_BLOCK = 256
+# Rendered (word, font size, stroke width) captions kept per render (LRU)
+GLYPH_CACHE_SIZE = 512
+# Frame lists shorter than this are captioned on the calling thread
+CAPTION_PARALLEL_MIN_FRAMES = 64
+
 # Default options for caption styling (white text, black outline).
 # Only one line is drawn: the current segment for this frame's time.
 DEFAULT_CAPTION_OPTIONS = {
@@ -30,7 +40,7 @@ DEFAULT_CAPTION_OPTIONS = {
     "line1_y_ratio": 0.12,       # Unused (no constant top line)
     "line2_y_ratio": 0.5,       # Vertical position of the current word (fraction of height)
     "show_emphasized": True,    # If False, no text is drawn
-    "word_separator": " ",      # Used when building full_text in _get_current_segment
+    "word_separator": " ",      # Unused (only the current word is drawn)
     # Pop animation for each word (scale from small to full; timing unchanged)
     "pop_effect": True,
     "pop_scale_start": 0.6,     # Start at 60% size
@@ -41,8 +51,13 @@ DEFAULT_CAPTION_OPTIONS = {
 }
 
 
+@lru_cache(maxsize=64)
 def _get_font(path: Optional[str], size: int) -> ImageFont.FreeTypeFont:
-    """Load a TrueType or OpenType font (.ttf or .otf) at given size. Fallback to default if path missing."""
+    """Load a TrueType or OpenType font (.ttf or .otf) at given size. Fallback to default if path missing.
+
+    Cached per (path, size): the font lookup and FreeType parse happen once, not per frame
+    (pop-in frames use one size per step, so the cache holds every size of a render).
+    """
     # Try user-provided path first
     if path:
         p = Path(path)
@@ -51,27 +66,38 @@ def _get_font(path: Optional[str], size: int) -> ImageFont.FreeTypeFont:
                 return ImageFont.truetype(str(p), size)
             except OSError:
                 pass
+    fallback = _fallback_font_path()
+    if fallback is not None:
+        try:
+            return ImageFont.truetype(fallback, size)
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=1)
+def _fallback_font_path() -> Optional[str]:
+    """First bundled or system font that loads, resolved once per process (None = Pillow default)."""
+    candidates = []
     # Try bundled fonts (src/assets/fonts/) — any .ttf or .otf
     assets_fonts = PROJECT_ROOT / "src" / "assets" / "fonts"
     if assets_fonts.is_dir():
         for ext in ("*.ttf", "*.otf"):
-            for try_path in sorted(assets_fonts.glob(ext)):
-                try:
-                    return ImageFont.truetype(str(try_path), size)
-                except OSError:
-                    continue
+            candidates.extend(sorted(assets_fonts.glob(ext)))
     # Try common system paths (Linux/Raspberry Pi)
-    for try_path in [
+    candidates += [
         Path("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"),
         Path("/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf"),
         Path("/usr/share/fonts/opentype/dejavu/DejaVuSans-Bold.otf"),
-    ]:
+    ]
+    for try_path in candidates:
         if try_path.exists():
             try:
-                return ImageFont.truetype(str(try_path), size)
+                ImageFont.truetype(str(try_path), DEFAULT_CAPTION_OPTIONS["font_size_emphasized"])
+                return str(try_path)
             except OSError:
                 continue
-    return ImageFont.load_default()
+    return None
 
 
 def alignment_to_word_segments(
@@ -106,48 +132,86 @@ def alignment_to_word_segments(
         )
     # Use provided text for word display only when length matches
     use_text = text is not None and len(text) == n
-    segments = []
-    i = 0
-    while i < n:
-        # Skip whitespace
-        while i < n and characters[i].strip() == "":
-            i += 1
-        if i >= n:
-            break
-        start_idx = i
-        word_chars = []
-        while i < n and characters[i].strip() != "":
-            word_chars.append(characters[i])
-            i += 1
-        end_idx = i - 1
-        word = "".join(word_chars) if not use_text else text[start_idx : end_idx + 1]
-        if word:
-            segments.append(
-                (
-                    word,
-                    character_start_times_seconds[start_idx],
-                    character_end_times_seconds[end_idx],
-                )
-            )
-    return segments
+    word_starts, word_ends = _word_runs(characters)
+    return [
+        (
+            text[start_idx : end_idx + 1] if use_text else "".join(characters[start_idx : end_idx + 1]),
+            character_start_times_seconds[start_idx],
+            character_end_times_seconds[end_idx],
+        )
+        for start_idx, end_idx in zip(word_starts, word_ends)
+    ]
+
+
+# Every code point str.strip() removes is at or below U+3000
+_WHITESPACE_TABLE_SIZE = 0x3001
 
 
-def _is_elevenlabs_alignment_payload(data: Any) -> bool:
-    """True if data looks like ElevenLabs timing-only payload (has alignment with character arrays)."""
+@lru_cache(maxsize=1)
+def _whitespace_table() -> np.ndarray:
+    """Lookup table: True where str.strip() removes the code point; the extra last slot (False)
+    stands for every code point above the table."""
+    table = np.zeros(_WHITESPACE_TABLE_SIZE + 1, dtype=bool)
+    table[[c for c in range(_WHITESPACE_TABLE_SIZE) if chr(c).isspace()]] = True
+    return table
+
+
+def _word_runs(characters: List[str]) -> Tuple[List[int], List[int]]:
+    """First and last character index of each run of non-whitespace entries.
+
+    An entry counts as whitespace when entry.strip() == "" (so empty entries split words too).
+    """
+    joined = "".join(characters)
+    if len(joined) == len(characters) and "" not in characters:
+        # One code point per entry (the normal alignment case): one table lookup per character
+        code_points = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+        in_word = ~_whitespace_table()[np.minimum(code_points, _WHITESPACE_TABLE_SIZE)]
+    else:
+        in_word = np.fromiter((c.strip() != "" for c in characters), dtype=bool, count=len(characters))
+    edges = np.diff(np.concatenate(([False], in_word, [False])).astype(np.int8))
+    return np.flatnonzero(edges == 1).tolist(), (np.flatnonzero(edges == -1) - 1).tolist()
+
+
+_ALIGNMENT_FIELDS_ERROR = (
+    "alignment must contain characters, character_start_times_seconds, character_end_times_seconds"
+)
+
+
+def _try_parse_elevenlabs(data: Any) -> Optional[List[Tuple[str, float, float]]]:
+    """Segments from an ElevenLabs timing-only payload, or None if data does not have that shape.
+
+    Detection and parsing share one pass over the alignment dict.
+    """
     if not isinstance(data, dict):
-        return False
+        return None
     align = data.get("alignment") or data.get("normalized_alignment")
     if not isinstance(align, dict):
-        return False
+        return None
     chars = align.get("characters")
     starts = align.get("character_start_times_seconds")
     ends = align.get("character_end_times_seconds")
-    return (
+    if not (
         isinstance(chars, list)
         and isinstance(starts, list)
         and isinstance(ends, list)
         and len(chars) == len(starts) == len(ends)
-    )
+    ):
+        return None
+    if not chars:
+        raise ValueError(_ALIGNMENT_FIELDS_ERROR)
+    return _alignment_segments(chars, starts, ends, data.get("text"))
+
+
+def _alignment_segments(chars: List[Any], starts: List[Any], ends: List[Any], text: Any) -> List[Tuple[str, float, float]]:
+    """Word segments from validated alignment arrays (optional display text)."""
+    # Normalize to strings; only the times at word boundaries are used, so only those become floats
+    characters = [str(c) for c in chars]
+    if text is not None:
+        text = str(text)
+    return [
+        (word, float(start), float(end))
+        for word, start, end in alignment_to_word_segments(characters, starts, ends, text=text)
+    ]
 
 
 def load_captions_from_elevenlabs_alignment(data: Dict[str, Any]) -> List[Tuple[str, float, float]]:
@@ -169,19 +233,10 @@ def load_captions_from_elevenlabs_alignment(data: Dict[str, Any]) -> List[Tuple[
     starts = align.get("character_start_times_seconds")
     ends = align.get("character_end_times_seconds")
     if not chars or not starts or not ends:
-        raise ValueError(
-            "alignment must contain characters, character_start_times_seconds, character_end_times_seconds"
-        )
+        raise ValueError(_ALIGNMENT_FIELDS_ERROR)
     if len(chars) != len(starts) or len(starts) != len(ends):
         raise ValueError("alignment arrays must have the same length")
-    # Normalize to list of strings and floats
-    characters = [str(c) for c in chars]
-    start_times = [float(s) for s in starts]
-    end_times = [float(e) for e in ends]
-    text = data.get("text")
-    if text is not None:
-        text = str(text)
-    return alignment_to_word_segments(characters, start_times, end_times, text=text)
+    return _alignment_segments(chars, starts, ends, data.get("text"))
 
 
 def load_captions(path_or_data: Union[str, Dict[str, Any]]) -> List[Tuple[str, float, float]]:
@@ -201,11 +256,11 @@ def load_captions(path_or_data: Union[str, Dict[str, Any]]) -> List[Tuple[str, f
         p = Path(path_or_data)
         if not p.exists():
             raise FileNotFoundError(f"Captions file not found: {path_or_data}")
-        with open(p, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_file_cached(p)
 
-    if _is_elevenlabs_alignment_payload(data):
-        return load_captions_from_elevenlabs_alignment(data)
+    segments = _try_parse_elevenlabs(data)
+    if segments is not None:
+        return segments
     # Legacy: array of {text, start, end}
     return load_captions_from_json_data(data, path_or_data if isinstance(path_or_data, str) else None)
 
@@ -243,8 +298,7 @@ def extract_highlight_options(path_or_data: Union[str, Dict[str, Any]]) -> Dict[
         p = Path(path_or_data)
         if not p.exists():
             return {}
-        with open(p, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_file_cached(p)
     opts = {}
     if isinstance(data, dict):
         if "highlighted_words" in data and isinstance(data["highlighted_words"], list):
@@ -257,54 +311,128 @@ def extract_highlight_options(path_or_data: Union[str, Dict[str, Any]]) -> Dict[
     return opts
 
 
+class _SegmentLookup(NamedTuple):
+    """Segment timings as parallel float64 arrays plus a sorted-start index for O(log N) lookups."""
+    starts: np.ndarray
+    ends: np.ndarray
+    max_end: np.ndarray  # running max of segment ends (covers overlapping segments)
+    is_sorted: bool
+    has_text: np.ndarray  # False for empty words (nothing to draw)
+
+
+def _build_segment_lookup(segments: List[Tuple[str, float, float]]) -> _SegmentLookup:
+    """Precompute the timing arrays and search index used by _get_current_segment."""
+    starts = np.fromiter((s[1] for s in segments), dtype=np.float64, count=len(segments))
+    ends = np.fromiter((s[2] for s in segments), dtype=np.float64, count=len(segments))
+    max_end = np.maximum.accumulate(ends) if len(ends) else ends
+    is_sorted = bool(np.all(starts[1:] >= starts[:-1]))
+    has_text = np.fromiter((bool(s[0]) for s in segments), dtype=bool, count=len(segments))
+    return _SegmentLookup(starts, ends, max_end, is_sorted, has_text)
+
+
+def _find_segment_index(t_sec: float, lookup: _SegmentLookup) -> Optional[int]:
+    """Index of the first segment whose [start, end) contains t_sec, or None."""
+    if lookup.is_sorted:
+        idx = int(np.searchsorted(lookup.starts, t_sec, side="right")) - 1
+        # No segment up to idx reaches t_sec
+        if idx < 0 or lookup.max_end[idx] <= t_sec:
+            return None
+        # Only segment idx can contain t_sec (the usual non-overlapping case)
+        if idx == 0 or lookup.max_end[idx - 1] <= t_sec:
+            return idx
+        starts, ends = lookup.starts[:idx + 1], lookup.ends[:idx + 1]
+    else:
+        starts, ends = lookup.starts, lookup.ends
+    hits = np.flatnonzero((starts <= t_sec) & (t_sec < ends))
+    return int(hits[0]) if len(hits) else None
+
+
 def _get_current_segment(
     t_sec: float,
     segments: List[Tuple[str, float, float]],
-) -> Tuple[str, Optional[str], Optional[int], Optional[float], Optional[float]]:
-    """Return (full_text, current_text, current_index, start_sec, end_sec) for t_sec.
+    lookup: Optional[_SegmentLookup] = None,
+) -> Tuple[Optional[str], Optional[int], Optional[float], Optional[float]]:
+    """Return (current_text, current_index, start_sec, end_sec) for t_sec.
 
     Only current_text used for drawing; timings enable pop progress calc.
+    Pass a lookup from _build_segment_lookup to avoid rebuilding it per call.
     """
     if not segments:
-        return "", None, None, None, None
-    # Full line is all segments joined (kept for possible future use; not drawn)
-    full_text = DEFAULT_CAPTION_OPTIONS["word_separator"].join(s[0] for s in segments)
+        return None, None, None, None
+    if lookup is None:
+        lookup = _build_segment_lookup(segments)
     # Current word is the segment whose [start, end) contains t_sec
-    for i, (text, start, end) in enumerate(segments):
-        if start <= t_sec < end:
-            return full_text, text, i, start, end
+    i = _find_segment_index(t_sec, lookup)
+    if i is not None:
+        text, start, end = segments[i]
+        return text, i, start, end
     # After last: keep last word (full duration for pop if needed)
     if t_sec >= segments[-1][2]:
         last_start, last_end = segments[-1][1], segments[-1][2]
-        return full_text, segments[-1][0], len(segments) - 1, last_start, last_end
+        return segments[-1][0], len(segments) - 1, last_start, last_end
     # Before first: none
-    return full_text, None, None, None, None
-
-
-def _draw_text_with_outline(
-    draw: ImageDraw.ImageDraw,
-    x: int,
-    y: int,
-    text: str,
-    font: ImageFont.FreeTypeFont,
-    fill: Tuple[int, int, int],
-    stroke_fill: Tuple[int, int, int],
-    stroke_width: int,
-    anchor: str = "lt",
-) -> None:
-    """Draw a single line of text with outline for readability on any background.
-    anchor e.g. 'lt' = left-top, 'mt' = middle-top."""
-    draw.text(
-        (x, y),
-        text,
-        font=font,
-        fill=fill,
-        stroke_width=stroke_width,
-        stroke_fill=stroke_fill,
-        anchor=anchor,
+    return None, None, None, None
+
+
+class _CaptionRenderContext(NamedTuple):
+    """Per-render caption settings that do not depend on the frame time."""
+    show: bool
+    font_path: Optional[str]
+    font: ImageFont.FreeTypeFont
+    font_size: int
+    fill: Tuple[int, int, int]
+    highlight_fill: Tuple[int, int, int]
+    highlight_set: FrozenSet[str]
+    stroke_fill: Tuple[int, int, int]
+    stroke_width: int
+    width: int
+    line_y: int
+    pop_effect: bool
+    pop_scale_start: float
+    pop_duration_ratio: float
+    glyph_cache: "OrderedDict[Tuple[str, int, int], List[_CaptionLayer]]"
+
+
+def _build_render_ctx(width: int, height: int, options: Optional[Dict[str, Any]] = None) -> _CaptionRenderContext:
+    """Resolve caption options once per render (font, colors, layout, pop settings)."""
+    opts = {**DEFAULT_CAPTION_OPTIONS, **(options or {})}
+    return _CaptionRenderContext(
+        show=bool(opts["show_emphasized"]),
+        font_path=opts["font_path"],
+        font=_get_font(opts["font_path"], opts["font_size_emphasized"]),
+        font_size=opts["font_size_emphasized"],
+        fill=opts["fill_color"],
+        highlight_fill=opts["highlight_color"],
+        highlight_set=frozenset(opts["highlighted_words"] or ()),
+        stroke_fill=opts["stroke_color"],
+        stroke_width=opts["stroke_width"],
+        width=width,
+        line_y=int(height * opts["line2_y_ratio"]),
+        pop_effect=bool(opts["pop_effect"]),
+        pop_scale_start=opts["pop_scale_start"],
+        pop_duration_ratio=opts["pop_duration_ratio"],
+        glyph_cache=OrderedDict(),
     )
 
 
+# Scratch draw context for text measurement (textbbox does not touch pixels)
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+@lru_cache(maxsize=4096)
+def _text_width(text: str, font_obj: ImageFont.FreeTypeFont, font_size: int) -> int:
+    """Get text width in pixels; fallback for default font (no textbbox).
+
+    Cached per (text, font, size): fonts come from the cached _get_font, so a word is measured
+    once per process, not once per render.
+    """
+    try:
+        bbox = _MEASURE_DRAW.textbbox((0, 0), text, font=font_obj)
+        return bbox[2] - bbox[0]
+    except (TypeError, AttributeError):
+        return len(text) * (font_size // 2)
+
+
 def overlay_captions_on_frame(
     frame_bgr: np.ndarray,
     t_sec: float,
@@ -326,116 +454,350 @@ def overlay_captions_on_frame(
     """
     if not segments:
         return
-    opts = {**DEFAULT_CAPTION_OPTIONS, **(options or {})}
-    if not opts["show_emphasized"]:
-        return
-    stroke_fill = opts["stroke_color"]
-    stroke_width = opts["stroke_width"]
-    font = _get_font(opts["font_path"], opts["font_size_emphasized"])
-    line_y_ratio = opts["line2_y_ratio"]
-
-    # Get current segment + timings for pop progress
-    _, current_text, _, seg_start, seg_end = _get_current_segment(t_sec, segments)
-    if not current_text:
+    lookup = _build_segment_lookup(segments)
+    # Before the first word or in a gap between words: nothing to draw, skip all setup
+    if t_sec < lookup.ends[-1] and _find_segment_index(t_sec, lookup) is None:
         return
+    ctx = _build_render_ctx(width, height, options)
+    seg_idx, scales = _caption_plan(np.array([t_sec]), lookup, ctx)
+    if seg_idx[0] >= 0:
+        _draw_caption(frame_bgr, segments[seg_idx[0]][0], scales[0], ctx)
+
+
+def _caption_plan(
+    times: np.ndarray,
+    lookup: _SegmentLookup,
+    ctx: _CaptionRenderContext,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-frame segment index (-1 = nothing drawn) and pop scale for an array of frame times."""
+    seg_idx = np.full(len(times), -1, dtype=np.intp)
+    if ctx.show and len(times):
+        if lookup.is_sorted:
+            # One binary search sweep: the last segment starting at or before each time
+            idx = np.searchsorted(lookup.starts, times, side="right") - 1
+            safe = np.maximum(idx, 0)
+            inside = (idx >= 0) & (lookup.max_end[safe] > times)
+            # Unique hit unless an earlier (overlapping) segment also reaches t
+            earlier_reaches = (idx > 0) & (lookup.max_end[np.maximum(idx - 1, 0)] > times)
+            seg_idx[inside & ~earlier_reaches] = idx[inside & ~earlier_reaches]
+            ambiguous = np.flatnonzero(inside & earlier_reaches)
+        else:
+            inside = np.zeros(len(times), dtype=bool)
+            ambiguous = np.arange(len(times))
+        times_list = times.tolist()
+        for k in ambiguous.tolist():
+            i = _find_segment_index(times_list[k], lookup)
+            if i is not None:
+                seg_idx[k] = i
+                inside[k] = True
+        # After last: keep last word
+        seg_idx[~inside & (times >= lookup.ends[-1])] = len(lookup.ends) - 1
+        # Empty words draw nothing
+        seg_idx[(seg_idx >= 0) & ~lookup.has_text[seg_idx]] = -1
+    return seg_idx, _pop_scales(times, seg_idx, lookup, ctx)
+
+
+def _pop_scales(
+    times: np.ndarray,
+    seg_idx: np.ndarray,
+    lookup: _SegmentLookup,
+    ctx: _CaptionRenderContext,
+) -> np.ndarray:
+    """Pop-in scale per frame: pop_scale_start -> 1.0 over the first pop_duration_ratio of each word."""
+    scales = np.ones(len(times))
+    drawn = seg_idx >= 0
+    if not ctx.pop_effect or not drawn.any():
+        return scales
+    seg_starts = lookup.starts[seg_idx[drawn]]
+    seg_ends = lookup.ends[seg_idx[drawn]]
+    dur = seg_ends - seg_starts
+    # Zero-length words skip the pop
+    timed = dur > 0
+    local_prog = np.zeros(len(dur))
+    np.divide(times[drawn] - seg_starts, dur, out=local_prog, where=timed)
+    local_prog = np.clip(local_prog, 0.0, 1.0)
+    popping = timed & (local_prog < ctx.pop_duration_ratio)
+    pop_prog = local_prog[popping] / ctx.pop_duration_ratio
+    drawn_scales = scales[drawn]
+    drawn_scales[popping] = ctx.pop_scale_start + (1.0 - ctx.pop_scale_start) * pop_prog
+    scales[drawn] = drawn_scales
+    return scales
+
+
+def _iter_caption_plan(
+    first_frame: int,
+    fps: float,
+    lookup: _SegmentLookup,
+    ctx: _CaptionRenderContext,
+    block: int = CAPTION_PLAN_BLOCK,
+) -> Iterator[Tuple[int, float]]:
+    """Yield (segment index, scale) per frame from first_frame on, planned block by block."""
+    while True:
+        times = np.arange(first_frame, first_frame + block) / fps
+        seg_idx, scales = _caption_plan(times, lookup, ctx)
+        yield from zip(seg_idx.tolist(), scales.tolist())
+        first_frame += block
 
-    # Highlight check: if word in list (case-insensitive), use special color
-    fill = opts["fill_color"]
-    if opts["highlighted_words"] and current_text.lower() in opts["highlighted_words"]:
-        fill = opts["highlight_color"]
 
-    # Convert frame to PIL
-    frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-    pil_img = Image.fromarray(frame_rgb)
-    draw = ImageDraw.Draw(pil_img)
+class _CaptionLayer(NamedTuple):
+    """One blend pass of a rendered caption, in the uint16 form used by _blend_layer."""
+    x: int
+    y: int
+    inv_alpha: np.ndarray  # (h, w, 1): 255 - coverage
+    premul: np.ndarray     # (h, w, 3): BGR * coverage + 128 (rounding bias of the /255)
+
+
+def _make_layer(position: Tuple[int, int], color_bgr: np.ndarray, coverage: np.ndarray) -> _CaptionLayer:
+    """Precompute the frame-independent half of the blend for a color and coverage mask."""
+    alpha = coverage.astype(np.uint16)[..., None]
+    premul = color_bgr.astype(np.uint16) * alpha + 128
+    return _CaptionLayer(position[0], position[1], 255 - alpha, premul)
 
-    def _text_width(draw_obj, text, font_obj):
-        """Get text width in pixels; fallback for default font (no textbbox)."""
-        try:
-            bbox = draw_obj.textbbox((0, 0), text, font=font_obj)
-            return bbox[2] - bbox[0]
-        except (TypeError, AttributeError):
-            return len(text) * (opts["font_size_emphasized"] // 2)
-
-    # Single line: current word, centered at line_y_ratio
-    line_y = int(height * line_y_ratio)
-    tw = _text_width(draw, current_text, font)
-    base_x = (width - tw) // 2
-
-    # Pop animation: scale up during first pop_duration_ratio of word time (linear ease)
-    # Keeps overall word timing/speed identical; just adds visual pop on appear
-    if opts["pop_effect"] and seg_start is not None and seg_end is not None:
-        dur = seg_end - seg_start
-        if dur > 0:
-            local_prog = max(0.0, min(1.0, (t_sec - seg_start) / dur))
-            pop_ratio = opts["pop_duration_ratio"]
-            if local_prog < pop_ratio:
-                # Pop from pop_scale_start to 1.0
-                pop_prog = local_prog / pop_ratio
-                scale = opts["pop_scale_start"] + (1.0 - opts["pop_scale_start"]) * pop_prog
-            else:
-                scale = 1.0
-        else:
-            scale = 1.0
-    else:
-        scale = 1.0
 
+def _blend_layer(frame_bgr: np.ndarray, layer: _CaptionLayer, scratch: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """Alpha-blend a layer onto frame_bgr in place, clipped to the frame.
+
+    Same integer math as Pillow's paste with a mask (out * (255 - a) + in * a, divided by 255
+    with rounding), so results match drawing the text with Pillow.
+
+    Args:
+        frame_bgr: BGR uint8 frame, modified in place.
+        layer: Layer from _caption_layers.
+        scratch: Optional uint16 (h, w, 3) work buffer, reused when large enough.
+
+    Returns:
+        The work buffer used (pass it to the next call to avoid per-frame allocations).
+    """
+    h, w = layer.inv_alpha.shape[:2]
+    x0, y0 = max(layer.x, 0), max(layer.y, 0)
+    x1 = min(layer.x + w, frame_bgr.shape[1])
+    y1 = min(layer.y + h, frame_bgr.shape[0])
+    if x1 <= x0 or y1 <= y0:
+        return scratch
+    rows, cols = y1 - y0, x1 - x0
+    if scratch is None or scratch.shape[0] < rows or scratch.shape[1] < cols:
+        if scratch is not None:
+            rows, cols = max(rows, scratch.shape[0]), max(cols, scratch.shape[1])
+        scratch = np.empty((rows, cols, 3), dtype=np.uint16)
+    src = (slice(y0 - layer.y, y1 - layer.y), slice(x0 - layer.x, x1 - layer.x))
+    roi = frame_bgr[y0:y1, x0:x1]
+    acc = np.multiply(roi, layer.inv_alpha[src], out=scratch[:y1 - y0, :x1 - x0])  # max 255 * 255
+    acc += layer.premul[src]
+    acc += acc >> 8
+    acc >>= 8
+    roi[...] = acc
+    return scratch
+
+
+@lru_cache(maxsize=GLYPH_CACHE_SIZE)
+def _glyph_mask(text: str, font_obj: ImageFont.FreeTypeFont, stroke_width: int) -> Tuple[int, int, np.ndarray]:
+    """Rasterize text once into an (x offset, y offset, read-only L coverage mask) for anchor 'lt'.
+
+    Shared across renders in the process (colors and placement are applied per render), so
+    later clips rendered by the same worker reuse the FreeType output.
+    """
+    left, top, right, bottom = _MEASURE_DRAW.textbbox(
+        (0, 0), text, font=font_obj, anchor="lt", stroke_width=stroke_width
+    )
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text(
+        (-left, -top), text, font=font_obj, fill=255,
+        stroke_width=stroke_width, stroke_fill=255, anchor="lt",
+    )
+    mask = np.array(mask)
+    mask.flags.writeable = False
+    return left, top, mask
+
+
+def _caption_layers(current_text: str, scale: float, ctx: _CaptionRenderContext) -> List[_CaptionLayer]:
+    """Rendered caption as blend layers, cached per (word, font size, stroke width) for the render.
+
+    Pop-in frames rasterize the word directly at the scaled font size. Blending the layers onto
+    a frame gives the same pixels as drawing the text on it with Pillow.
+    """
     if scale == 1.0:
-        # No pop: direct draw
-        _draw_text_with_outline(
-            draw, base_x, line_y, current_text, font, fill, stroke_fill, stroke_width, anchor="lt"
-        )
+        font_size, font, stroke_width = ctx.font_size, ctx.font, ctx.stroke_width
     else:
-        # Pop: render to temp img at full size, scale, paste centered
-        temp = Image.new("RGBA", (int(tw * 1.2), int(opts["font_size_emphasized"] * 1.5)), (0, 0, 0, 0))
-        tdraw = ImageDraw.Draw(temp)
-        # Center in temp
-        t_x = (temp.width - tw) // 2
-        t_y = (temp.height - opts["font_size_emphasized"]) // 2
-        _draw_text_with_outline(
-            tdraw, t_x, t_y, current_text, font, fill, stroke_fill, stroke_width, anchor="lt"
-        )
-        # Scale temp
-        new_size = (int(temp.width * scale), int(temp.height * scale))
-        scaled = temp.resize(new_size, Image.LANCZOS)
-        # Paste centered on main (adjust for scale shrink)
-        paste_x = base_x - (new_size[0] - tw) // 2
-        paste_y = line_y - (new_size[1] - opts["font_size_emphasized"]) // 2
-        pil_img.paste(scaled, (paste_x, paste_y), scaled)
+        font_size = max(1, round(ctx.font_size * scale))
+        font = _get_font(ctx.font_path, font_size)
+        stroke_width = max(1, round(ctx.stroke_width * scale)) if ctx.stroke_width else 0
+    key = (current_text, font_size, stroke_width)
+    layers = ctx.glyph_cache.get(key)
+    if layers is not None:
+        ctx.glyph_cache.move_to_end(key)
+        return layers
+
+    # Highlight check: if word in set (case-insensitive), use special color
+    fill = ctx.fill
+    if ctx.highlight_set and current_text.lower() in ctx.highlight_set:
+        fill = ctx.highlight_fill
+
+    # Single line: current word, centered on the full-size word's box (pop grows from its middle)
+    tw = _text_width(current_text, font, font_size)
+    x = (ctx.width - tw) // 2
+    y = ctx.line_y + (ctx.font_size - font_size) // 2
+
+    # Outline then fill, as coverage masks blended with solid colors (what draw.text does)
+    layers = []
+    passes = [(ctx.stroke_fill, stroke_width)] if stroke_width else []
+    if not passes or fill != ctx.stroke_fill:
+        passes.append((fill, 0))
+    for color, pass_stroke in passes:
+        left, top, mask = _glyph_mask(current_text, font, pass_stroke)
+        color_bgr = np.array(color[::-1], dtype=np.uint8)
+        layers.append(_make_layer((x + left, y + top), color_bgr, mask))
+
+    ctx.glyph_cache[key] = layers
+    if len(ctx.glyph_cache) > GLYPH_CACHE_SIZE:
+        ctx.glyph_cache.popitem(last=False)
+    return layers
+
+
+def _draw_caption(
+    frame_bgr: np.ndarray,
+    current_text: str,
+    scale: float,
+    ctx: _CaptionRenderContext,
+) -> None:
+    """Draw current_text on frame_bgr in place at the given pop scale using a prebuilt render context.
 
-    # Write back to BGR frame
-    frame_bgr[:] = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+    Only the caption's bounding box is touched; the frame stays BGR (no full-frame conversion).
+    """
+    for layer in _caption_layers(current_text, scale, ctx):
+        _blend_layer(frame_bgr, layer)
 
 
 def overlay_captions_on_frames(
-    frames: List[np.ndarray],
+    frames: Union[List[np.ndarray], np.ndarray],
     segments: List[Tuple[str, float, float]],
     fps: float,
     width: int,
     height: int,
     options: Optional[Dict[str, Any]] = None,
     show_progress: bool = True,
+    max_workers: Optional[int] = None,
 ) -> None:
     """Draw captions on each frame in place. Modifies frames list in place.
 
+    The same array may appear several times in frames (e.g. static hold frames);
+    every occurrence of such an array, and any read-only frame (e.g. a view into
+    a shared pan-zoom image), is replaced by a copy before drawing.
+
+    Frames are independent, so the pixel blending is spread over a thread pool
+    (NumPy releases the GIL in its array loops).
+
     Args:
-        frames: List of BGR frames.
+        frames: List of BGR frames, or one writable (N, H, W, 3) array drawn on through
+            per-frame views (no copies).
         segments: List of (text, start_sec, end_sec).
         fps: Frames per second.
         width, height: Frame dimensions.
         options: Optional caption style overrides.
         show_progress: Print progress every 60 frames.
+        max_workers: Threads blending captions into frames (default: CPU count).
     """
     if not segments:
         return
     total = len(frames)
-    for frame_idx, frame in enumerate(frames):
-        t_sec = frame_idx / fps
-        overlay_captions_on_frame(frame, t_sec, segments, width, height, options)
+    ctx = _build_render_ctx(width, height, options)
+    # Segment and pop scale for every frame, computed up front
+    seg_idx, scales = _caption_plan(np.arange(total) / fps, _build_segment_lookup(segments), ctx)
+    if isinstance(frames, np.ndarray):
+        if not frames.flags.writeable:
+            raise ValueError("frames array must be writable")
+        # Views into one buffer never alias each other
+        shared_ids = set()
+    else:
+        shared_ids = {frame_id for frame_id, count in Counter(map(id, frames)).items() if count > 1}
+    # Glyphs are rendered (and the cache mutated) here; the threads below only blend pixels
+    jobs = []
+    for frame_idx, (frame, i, scale) in enumerate(zip(frames, seg_idx.tolist(), scales.tolist())):
+        if i >= 0:
+            if id(frame) in shared_ids or not frame.flags.writeable:
+                frame = frame.copy()
+                frames[frame_idx] = frame
+            jobs.append((frame, _caption_layers(segments[i][0], scale, ctx)))
+        else:
+            jobs.append(None)
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1 and total >= CAPTION_PARALLEL_MIN_FRAMES:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="captions") as executor:
+            _run_caption_jobs(executor.map(_blend_caption_job, jobs), total, show_progress)
+    else:
+        _run_caption_jobs(map(_blend_caption_job, jobs), total, show_progress)
+
+
+def _blend_caption_job(job: Optional[Tuple[np.ndarray, List[_CaptionLayer]]]) -> None:
+    """Blend one frame's caption layers (None = uncaptioned frame)."""
+    if job is not None:
+        frame, layers = job
+        for layer in layers:
+            _blend_layer(frame, layer)
+
+
+def _run_caption_jobs(results: Iterable[None], total: int, show_progress: bool) -> None:
+    """Drain caption jobs in frame order, printing progress every 60 frames."""
+    for frame_idx, _ in enumerate(results):
         if show_progress and frame_idx % 60 == 0 and frame_idx > 0:
             print(f"Captions: {frame_idx}/{total} frames ({frame_idx * 100 // total}%)")
 
 
+def iter_overlay_captions(
+    frames: Iterable[np.ndarray],
+    segments: List[Tuple[str, float, float]],
+    fps: float,
+    width: int,
+    height: int,
+    options: Optional[Dict[str, Any]] = None,
+    start_frame: int = 0,
+) -> Iterator[np.ndarray]:
+    """Streaming variant of overlay_captions_on_frames for frame generators.
+
+    Input frames are never modified: each captioned frame is copied into a single
+    scratch buffer that is drawn on and yielded, so consume it before the next
+    frame. Frames with no caption are yielded as-is. A read-only array repeated
+    under the same caption (e.g. a hold still) is treated as unchanged, so the
+    buffer is re-yielded without copying or drawing again; writable frames, such
+    as reused reveal buffers, are always redrawn.
+
+    Args:
+        frames: Iterable of BGR frames (may repeat the same array, e.g. hold frames).
+        segments: List of (text, start_sec, end_sec).
+        fps: Frames per second.
+        width, height: Frame dimensions.
+        options: Optional caption style overrides.
+        start_frame: Index of the first frame in the full video (for clips rendered separately).
+
+    Yields:
+        np.ndarray: Captioned BGR frame (shared scratch buffer) or the untouched input frame.
+    """
+    if not segments:
+        yield from frames
+        return
+    ctx = _build_render_ctx(width, height, options)
+    plan = _iter_caption_plan(start_frame, fps, _build_segment_lookup(segments), ctx)
+    buffer = scratch = None
+    buffer_source = buffer_layers = None  # what buffer currently holds
+    for frame, (i, scale) in zip(frames, plan):
+        if i < 0:
+            buffer_source = None
+            yield frame
+            continue
+        if buffer is None:
+            buffer = np.empty_like(frame)
+        layers = _caption_layers(segments[i][0], scale, ctx)
+        # Same read-only still under the same caption (e.g. hold frames): buffer already has the result
+        if frame is not buffer_source or layers is not buffer_layers:
+            np.copyto(buffer, frame)
+            for layer in layers:
+                scratch = _blend_layer(buffer, layer, scratch)
+            # Writable frames (e.g. reused reveal buffers) may be refilled in place, so never skip them
+            buffer_source = None if frame.flags.writeable else frame
+            buffer_layers = layers
+        yield buffer
+
+
 def load_captions_from_json(path: str) -> List[Tuple[str, float, float]]:
     """Load caption segments from a JSON file (auto-detects format).
 
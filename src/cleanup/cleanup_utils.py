@@ -1,5 +1,6 @@
 """Utilities for managing and cleaning up temporary files"""
 
+import os
 import shutil
 from pathlib import Path
 
@@ -16,8 +17,9 @@ class CleanupManager:
         Args:
             temp_dir: Path to temporary directory
         """
-        self.temp_dir = Path(temp_dir)
-        self.temp_files = []
+        self.temp_dir = Path(os.path.abspath(temp_dir))
+        # Insertion-ordered set: registering the same file twice deletes it once
+        self.temp_files = {}
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
     def register_temp_file(self, file_path):
@@ -26,25 +28,31 @@ class CleanupManager:
         Args:
             file_path: Path to temporary file
         """
-        self.temp_files.append(Path(file_path))
+        self.temp_files[Path(os.path.abspath(file_path))] = None
 
     def cleanup(self):
         """Clean up all registered temporary files and the temp directory (summary only to reduce logs)."""
         cleaned_count = 0
         # Remove registered temp files
+        # Unlink directly (one syscall per file); already-missing files are simply skipped.
+        # Files inside temp_dir are left to the single rmtree below.
         for temp_file in self.temp_files:
+            if self.temp_dir in temp_file.parents:
+                continue
             try:
-                if temp_file.exists():
-                    temp_file.unlink()
-                    cleaned_count += 1
+                temp_file.unlink()
+                cleaned_count += 1
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 log_warning(f"Could not delete {temp_file}: {e}")
 
         # Clean the entire temp directory
         try:
-            if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
-                cleaned_count += 1  # Count dir as cleaned
+            shutil.rmtree(self.temp_dir)
+            cleaned_count += 1  # Count dir as cleaned
+        except FileNotFoundError:
+            pass
         except Exception as e:
             log_warning(f"Could not delete temp directory {self.temp_dir}: {e}")
 
@@ -5,7 +5,6 @@ Creates videos where images are zoomed in and panned (per-image 'direction' in J
 """
 
 import argparse
-import json
 from pathlib import Path
 # Relative imports for package structure (CLI in src/cli/, modules in src/)
 from ..config.config import ASPECT_RATIOS, QUALITY_PRESETS, TEMP_DIR
@@ -14,6 +13,7 @@ from ..download.download_utils import is_url, resolve_audio_path
 from ..cleanup.cleanup_utils import CleanupManager
 from ..utils.error_handler import handle_error
 from ..utils.config_utils import validate_image_configs
+from ..utils.json_utils import load_json_file, JSONDecodeError
 # Colored logging for differentiation (success green, etc.)
 from ..utils.log_utils import log_success, log_info
 
@@ -23,8 +23,10 @@ def _load_config(config_path_str):
     config_path = Path(config_path_str)
     if not config_path.exists():
         handle_error(f"Config file not found: {config_path}")
-    with open(config_path, "r") as f:
-        data = json.load(f)
+    try:
+        data = load_json_file(config_path)
+    except JSONDecodeError as e:
+        handle_error(f"Invalid JSON in config file: {e}")
     if isinstance(data, dict) and "images" in data:
         return data["images"], data
     if isinstance(data, list):
@@ -107,8 +109,10 @@ Output videos are saved to output/ directory.
         ap = Path(avatars_path)
         if not ap.exists():
             handle_error(f"Avatars file not found: {avatars_path}")
-        with open(ap, "r") as f:
-            avatars = json.load(f)
+        try:
+            avatars = load_json_file(ap)
+        except JSONDecodeError as e:
+            handle_error(f"Invalid JSON in avatars file: {e}")
         log_info(f"Loaded {len(avatars)} avatar video(s) from {avatars_path}")
 
     if audio_path:
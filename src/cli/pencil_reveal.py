@@ -11,8 +11,6 @@ import sys
 from pathlib import Path
 # Relative imports for package structure (CLI in src/cli/, modules in src/)
 from ..config.config import PENCIL_SIZE, TEMP_DIR, calculate_dimensions, ASPECT_RATIOS, QUALITY_PRESETS
-from ..cursor.cursor_utils import load_pencil_cursor, create_simple_pencil_cursor
-from ..video.video_writer import create_reveal_video, create_multi_reveal_video
 # Relative import for grouped structure (download now in subdir)
 from ..download.download_utils import is_url, resolve_audio_path
 from ..cleanup.cleanup_utils import CleanupManager
@@ -29,8 +27,8 @@ def main():
         print("Usage:")
         print("  Single image mode:")
         print("    python -m src.cli.pencil_reveal <input_image> [OPTIONS]")
-        print("    Example: python -m src.cli.pencil_reveal image.png output.mp4")
-        print("    Example: python -m src.cli.pencil_reveal image.png hand_pencil.png output.mp4")
+        print("    Example: python -m src.cli.pencil_reveal image.png --output output.mp4")
+        print("    Example: python -m src.cli.pencil_reveal image.png --cursor hand_pencil.png --output output.mp4")
         print("    Example: python -m src.cli.pencil_reveal https://example.com/image.jpg output.mp4")
         print()
         print("  Multi-image mode:")
@@ -38,6 +36,8 @@ def main():
         print("    Example: python -m src.cli.pencil_reveal --multi config.json output.mp4")
         print()
         print("  Options (single and multi):")
+        print("    --cursor <file>    Custom pencil cursor image (legacy: positional .png/.jpg)")
+        print("    --output <file>    Output video filename (legacy: positional .mp4/.avi)")
         print("    --audio <file>     Add background music (mp3, wav, etc.)")
         print("    --captions <file>  Add timed captions from JSON (word/letter timing)")
         print("    --volume <0.0-1.0> Set audio volume (default: 1.0)")
@@ -100,19 +100,10 @@ def _handle_single_image_mode():
     captions_path = common_opts["captions_path"]
     image_type = common_opts["image_type"]
 
-    # Manual scan remaining args for mode-specific positionals (cursor/output; short, no chain)
-    # (common parser's parse_known_args ignores these)
-    hand_pencil_path = None
-    use_custom_cursor = False
-    output_video = None
-    for arg in raw_args[1:]:
-        if not arg.startswith("--") and Path(arg).suffix.lower() in ['.png', '.jpg', '.jpeg'] and not use_custom_cursor:
-            # Hand pencil cursor (optional)
-            hand_pencil_path = Path(arg)
-            use_custom_cursor = True
-        elif not arg.startswith("--") and Path(arg).suffix.lower() in ['.mp4', '.avi']:
-            # Output video (optional)
-            output_video = arg
+    # Cursor/output from --cursor/--output (legacy positionals still accepted)
+    hand_pencil_path = common_opts["cursor_path"]
+    use_custom_cursor = hand_pencil_path is not None
+    output_video = common_opts["output_video"]
 
     # Validate input (URL or local path)
     if not is_url(input_image_arg):
@@ -166,6 +157,8 @@ def _handle_single_image_mode():
 
         else:
             # Normal reveal animation for scene type
+            # Relative import for grouped structure (video now in subdir)
+            from ..video.video_writer import create_reveal_video
             video_path, s3_url = create_reveal_video(
                 input_image_arg, output_video, pencil_cursor, cursor_size,
                 cleanup_manager=cleanup,
@@ -210,18 +203,10 @@ def _handle_multi_image_mode():
     quality = common_opts["quality"]
     captions_path = common_opts["captions_path"]
 
-    # Manual scan for mode-specific positionals (cursor/output; short, no options chain)
-    hand_pencil_path = None
-    use_custom_cursor = False
-    output_video = None
-    for arg in raw_args:
-        if not arg.startswith("--") and Path(arg).suffix.lower() in ['.png', '.jpg', '.jpeg'] and not use_custom_cursor:
-            # Hand pencil cursor (optional in multi too)
-            hand_pencil_path = Path(arg)
-            use_custom_cursor = True
-        elif not arg.startswith("--") and Path(arg).suffix.lower() in ['.mp4', '.avi']:
-            # Output video (optional)
-            output_video = arg
+    # Cursor/output from --cursor/--output (legacy positionals still accepted)
+    hand_pencil_path = common_opts["cursor_path"]
+    use_custom_cursor = hand_pencil_path is not None
+    output_video = common_opts["output_video"]
 
     # Generate UUID filename if not provided
     if output_video is None:
@@ -249,6 +234,8 @@ def _handle_multi_image_mode():
         if audio_path:
             audio_path = resolve_audio_path(audio_path, cleanup)
 
+        # Relative import for grouped structure (video now in subdir)
+        from ..video.video_writer import create_multi_reveal_video
         video_path, s3_url = create_multi_reveal_video(
             image_configs, output_video, pencil_cursor, cursor_size,
             cleanup_manager=cleanup,
@@ -282,6 +269,9 @@ def _load_cursor(hand_pencil_path, use_custom_cursor):
     Returns:
         tuple: (pencil_cursor, cursor_size)
     """
+    # Relative import for grouped structure (cursor now in subdir)
+    from ..cursor.cursor_utils import load_pencil_cursor, create_simple_pencil_cursor
+
     if use_custom_cursor and hand_pencil_path and hand_pencil_path.exists():
         print(f"Loading custom pencil cursor: {hand_pencil_path}")
         pencil_cursor = load_pencil_cursor(hand_pencil_path, PENCIL_SIZE)
@@ -27,6 +27,16 @@ QUALITY_PRESETS = {
     '2160p': 2160,  # 4K
 }
 
+# x264 speed/size trade-off per quality preset (ultrafast is left for a preview tier)
+X264_PRESETS = {
+    '480p': 'faster',
+    '720p': 'faster',
+    '1080p': 'medium',
+    '1440p': 'medium',
+    '2160p': 'medium',
+}
+DEFAULT_X264_PRESET = 'faster'
+
 # Default settings
 DEFAULT_ASPECT_RATIO = '9:16'
 DEFAULT_QUALITY = '720p'
@@ -62,6 +72,20 @@ def calculate_dimensions(aspect_ratio=None, quality=None):
 
     return width, height
 
+def get_x264_preset(height):
+    """Return the x264 preset for a video height (matches QUALITY_PRESETS heights)
+
+    Args:
+        height: Video height in pixels
+
+    Returns:
+        str: x264 -preset value
+    """
+    for quality, preset_height in QUALITY_PRESETS.items():
+        if preset_height == height:
+            return X264_PRESETS.get(quality, DEFAULT_X264_PRESET)
+    return DEFAULT_X264_PRESET
+
 # Video dimensions (default)
 WIDTH, HEIGHT = calculate_dimensions()
 FPS = 30
@@ -107,3 +131,8 @@ def calculate_cursor_size(width, height):
 DEFAULT_ZOOM_LEVEL = 1.1  # 10% zoom in (1.0 = no zoom, 1.1 = 10% larger)
 DEFAULT_PAN_DISTANCE_RATIO = 0.15  # 15% of image height as pan distance
 DEFAULT_PAN_DIRECTION = "up"  # "up", "down", "left", "right" - starting direction for pan-zoom (alternates for multi-image)
+
+# S3 upload settings (multipart transfers for rendered videos)
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # bytes; files above this upload in parts
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024  # bytes per part
+S3_MAX_CONCURRENCY = 10  # parallel part uploads
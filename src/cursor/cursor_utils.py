@@ -2,7 +2,10 @@
 
 import cv2
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
+# Relative import for grouped structure
+from ..image.image_utils import resize_interpolation
 
 
 def load_pencil_cursor(pencil_path, size):
@@ -13,7 +16,7 @@ def load_pencil_cursor(pencil_path, size):
         size: Desired size (width/height) of the square cursor
 
     Returns:
-        numpy.ndarray: Cursor image with alpha channel (RGBA)
+        numpy.ndarray: Cursor image with alpha channel (BGRA)
     """
     cursor = cv2.imread(str(pencil_path), cv2.IMREAD_UNCHANGED)
 
@@ -32,7 +35,7 @@ def load_pencil_cursor(pencil_path, size):
     new_w = int(w * scale)
     new_h = int(h * scale)
 
-    cursor = cv2.resize(cursor, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+    cursor = cv2.resize(cursor, (new_w, new_h), interpolation=resize_interpolation(scale))
 
     # Pad to square if needed
     if new_w != new_h:
@@ -45,14 +48,17 @@ def load_pencil_cursor(pencil_path, size):
     return cursor
 
 
+@lru_cache(maxsize=4)
 def create_simple_pencil_cursor(size):
     """Create a simple pencil hand cursor fallback
 
+    Cached per size for repeated runs in one process; the returned array is shared and read-only.
+
     Args:
         size: Desired size (width/height) of the square cursor
 
     Returns:
-        numpy.ndarray: Cursor image with alpha channel (RGBA)
+        numpy.ndarray: Cursor image with alpha channel (BGRA)
     """
     cursor = np.zeros((size, size, 4), dtype=np.uint8)
     center = size // 2
@@ -76,4 +82,36 @@ def create_simple_pencil_cursor(size):
     ], np.int32)
     cv2.fillPoly(cursor, [tip_pts], (40, 40, 40, 255))
 
+    cursor.flags.writeable = False
     return cursor
+
+
+def premultiply_cursor(cursor):
+    """Split a BGRA cursor into premultiplied color and alpha for fast blending
+
+    Args:
+        cursor: Cursor image with alpha channel (numpy.ndarray, BGRA uint8)
+
+    Returns:
+        tuple: (premultiplied BGR as float32 (H, W, 3), alpha as float32 (H, W) in 0.0-1.0)
+    """
+    alpha = cursor[:, :, 3].astype(np.float32) * (1.0 / 255.0)
+    premultiplied = cursor[:, :, :3].astype(np.float32) * alpha[:, :, np.newaxis]
+    return premultiplied, alpha
+
+
+def cursor_blend_layers(cursor_premul, cursor_alpha, alpha_multiplier=1.0):
+    """Quantize a premultiplied cursor to uint8 layers for cv2 blending at a given opacity
+
+    Args:
+        cursor_premul: Premultiplied BGR (float32, from premultiply_cursor)
+        cursor_alpha: Alpha in 0.0-1.0 (float32, from premultiply_cursor)
+        alpha_multiplier: Extra opacity factor for fade effects (0.0 to 1.0)
+
+    Returns:
+        tuple: (premultiplied BGR uint8 (H, W, 3), inverse alpha uint8 (H, W, 3) in 0-255)
+    """
+    m = np.float32(alpha_multiplier)
+    premul = np.rint(cursor_premul * m).astype(np.uint8)
+    inv_alpha = np.rint((1 - cursor_alpha * m) * 255).astype(np.uint8)
+    return premul, cv2.merge([inv_alpha] * 3)
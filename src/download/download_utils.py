@@ -1,6 +1,5 @@
-"""Utilities for downloading images from URLs"""
+"""Utilities for downloading images from URLs (requests is imported on first download, not at CLI startup)"""
 
-import requests
 import hashlib
 from pathlib import Path
 from urllib.parse import urlparse
@@ -40,6 +39,8 @@ def download_image(url, cleanup_manager=None):
     if not is_url(url):
         raise ValueError(f"Invalid URL: {url}")
 
+    import requests
+
     try:
         # Get file extension from URL
         parsed_url = urlparse(url)
@@ -90,6 +91,8 @@ def download_audio(url, cleanup_manager=None):
     if not is_url(url):
         raise ValueError(f"Invalid URL: {url}")
 
+    import requests
+
     try:
         # Get file extension from URL or default to mp3
         parsed_url = urlparse(url)
@@ -172,6 +175,8 @@ def download_video(url, cleanup_manager=None):
     if not is_url(url):
         raise ValueError(f"Invalid URL: {url}")
 
+    import requests
+
     try:
         # Get file extension from URL or default to mp4
         parsed_url = urlparse(url)
@@ -2,11 +2,58 @@
 
 import cv2
 import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 # Relative import for grouped structure
 from ..download.download_utils import resolve_image_path, resolve_video_path
 from ..config.config import FPS
 
+_EXHAUSTED = object()
+
+
+def ensure_bgr_uint8(image, name="image"):
+    """Check a frame is 3-channel uint8 (BGR as loaded by cv2.imread), the format piped to ffmpeg as bgr24
+
+    Args:
+        image: Image to check (numpy.ndarray)
+        name: Name used in the error message
+
+    Raises:
+        ValueError: If the image is not an (H, W, 3) uint8 array
+    """
+    if image.dtype != np.uint8 or image.ndim != 3 or image.shape[2] != 3:
+        raise ValueError(f"{name} must be a BGR uint8 image of shape (H, W, 3), got {image.dtype} {image.shape}")
+
+
+def read_only_view(image):
+    """Read-only view of an image, for streams that repeat one still frame
+
+    Consumers such as iter_overlay_captions only treat a repeated array as unchanged
+    when it cannot be written to.
+
+    Args:
+        image: Image to wrap (numpy.ndarray)
+
+    Returns:
+        numpy.ndarray: Non-writable view sharing image's memory
+    """
+    view = image.view()
+    view.flags.writeable = False
+    return view
+
+
+def resize_interpolation(scale):
+    """Pick a resize filter for one-shot image prep (Lanczos is overkill for static frames)
+
+    Args:
+        scale: Resize factor (new size / old size)
+
+    Returns:
+        int: cv2.INTER_AREA when shrinking, cv2.INTER_CUBIC when enlarging
+    """
+    return cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC
+
 
 def load_and_resize_image(image_path_or_url, target_width, target_height, cleanup_manager=None):
     """Load image and fit it to canvas with letterboxing
@@ -38,7 +85,7 @@ def load_and_resize_image(image_path_or_url, target_width, target_height, cleanu
     new_h = int(img_h * scale)
 
     # Resize image
-    resized = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+    resized = cv2.resize(img, (new_w, new_h), interpolation=resize_interpolation(scale))
 
     # Center on canvas
     x_offset = (target_width - new_w) // 2
@@ -48,6 +95,43 @@ def load_and_resize_image(image_path_or_url, target_width, target_height, cleanu
     return canvas
 
 
+def prefetch_images(image_paths, target_width, target_height, cleanup_manager=None,
+                    max_workers=4, lookahead=2):
+    """Yield letterboxed images in order while the next ones download/decode in background threads
+
+    At most `lookahead` images are in flight ahead of the consumer, so memory stays bounded.
+
+    Args:
+        image_paths: Iterable of image paths/URLs (None entries yield None)
+        target_width: Target canvas width
+        target_height: Target canvas height
+        cleanup_manager: Optional CleanupManager for temp file cleanup
+        max_workers: Number of loader threads
+        lookahead: Number of images loaded ahead of the one being consumed
+
+    Yields:
+        numpy.ndarray: Resized image on white canvas (same order as image_paths)
+    """
+    def _load_one(path):
+        if path is None:
+            return None
+        return load_and_resize_image(path, target_width, target_height, cleanup_manager)
+
+    paths = iter(image_paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append(executor.submit(_load_one, path))
+            if len(pending) > lookahead:
+                break
+        while pending:
+            image = pending.popleft().result()
+            next_path = next(paths, _EXHAUSTED)
+            if next_path is not _EXHAUSTED:
+                pending.append(executor.submit(_load_one, next_path))
+            yield image
+
+
 def _letterbox_frame(frame, target_width, target_height):
     """Fit a single BGR frame to canvas with letterboxing (white fill). Same logic as load_and_resize_image."""
     canvas = np.ones((target_height, target_width, 3), dtype=np.uint8) * 255
@@ -55,7 +139,7 @@ def _letterbox_frame(frame, target_width, target_height):
     scale = min(target_width / img_w, target_height / img_h)
     new_w = int(img_w * scale)
     new_h = int(img_h * scale)
-    resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+    resized = cv2.resize(frame, (new_w, new_h), interpolation=resize_interpolation(scale))
     x_offset = (target_width - new_w) // 2
     y_offset = (target_height - new_h) // 2
     canvas[y_offset : y_offset + new_h, x_offset : x_offset + new_w] = resized
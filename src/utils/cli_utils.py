@@ -7,6 +7,10 @@ from ..download.download_utils import is_url
 from ..config.config import ASPECT_RATIOS, QUALITY_PRESETS
 
 
+LEGACY_CURSOR_SUFFIXES = frozenset({".png", ".jpg", ".jpeg"})
+LEGACY_OUTPUT_SUFFIXES = frozenset({".mp4", ".avi"})
+
+
 def parse_common_options(args_list, support_type=False, support_cursor=False):
     """Parse common CLI options (audio, ratio, etc.) using argparse.
     Modular helper to eliminate if-else chains; shared across modes/scripts.
@@ -29,11 +33,11 @@ def parse_common_options(args_list, support_type=False, support_cursor=False):
     if support_type:
         parser.add_argument("--type", choices=["scene", "cover"], default="scene", help="Image type")
     if support_cursor:
-        # Cursor handled separately in logic
-        pass
+        parser.add_argument("--cursor", help="Custom pencil cursor image")
+        parser.add_argument("--output", help="Output video filename")
 
     # Parse known args, ignore unknowns for flexibility
-    parsed, _ = parser.parse_known_args(args_list)
+    parsed, extras = parser.parse_known_args(args_list)
 
     # Post-parse validations (volume, paths)
     if not 0.0 <= parsed.volume <= 1.0:
@@ -56,6 +60,15 @@ def parse_common_options(args_list, support_type=False, support_cursor=False):
         else:
             audio_path = audio_arg
 
+    cursor_path = None
+    output_video = None
+    if support_cursor:
+        # Explicit flags win; legacy positionals are classified by extension (first image = cursor)
+        legacy_cursor, legacy_output = _split_legacy_positionals(extras)
+        cursor_arg = parsed.cursor or legacy_cursor
+        cursor_path = Path(cursor_arg) if cursor_arg else None
+        output_video = parsed.output or legacy_output
+
     return {
         "audio_path": audio_path,
         "audio_volume": parsed.volume,
@@ -64,4 +77,21 @@ def parse_common_options(args_list, support_type=False, support_cursor=False):
         "quality": parsed.quality,
         "captions_path": captions_path,
         "image_type": getattr(parsed, "type", "scene") if support_type else None,
+        "cursor_path": cursor_path,
+        "output_video": output_video,
     }
+
+
+def _split_legacy_positionals(extras):
+    """Pick cursor image and output video from leftover positionals (pre --cursor/--output syntax)."""
+    cursor_arg = None
+    output_arg = None
+    for arg in extras:
+        if arg.startswith("-"):
+            continue
+        suffix = Path(arg).suffix.lower()
+        if suffix in LEGACY_CURSOR_SUFFIXES and cursor_arg is None:
+            cursor_arg = arg
+        elif suffix in LEGACY_OUTPUT_SUFFIXES:
+            output_arg = arg
+    return cursor_arg, output_arg
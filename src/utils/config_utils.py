@@ -1,11 +1,24 @@
-import json
+from functools import lru_cache
 from pathlib import Path
 
 from .error_handler import handle_error
+from .json_utils import load_json_file, JSONDecodeError
 # Relative import for grouped structure (download now in subdir)
 from ..download.download_utils import is_url
 
 
+@lru_cache(maxsize=4096)
+def _cached_exists(path_str):
+    """Path existence check memoized per string (configs often repeat the same paths)"""
+    return Path(path_str).exists()
+
+
+@lru_cache(maxsize=4096)
+def _cached_is_url(value):
+    """is_url memoized per string"""
+    return is_url(value)
+
+
 def validate_image_configs(image_configs, require_image_key=True, validate_types=False, allow_video=False):
     """Validate image configs list (common; supports optional 'direction', 'avatar_video' for pan_zoom).
     If allow_video=True (pan_zoom), each item may have 'image'/'url' OR 'video'; optional 'enablePanZoom' and 'seconds' for video."""
@@ -27,9 +40,8 @@ def validate_image_configs(image_configs, require_image_key=True, validate_types
                 handle_error(f"Invalid 'enablePanZoom' at index {idx}: must be true or false")
             if has_video:
                 video_arg = config.get("video")
-                if not is_url(video_arg):
-                    video_path = Path(video_arg)
-                    if not video_path.exists():
+                if not _cached_is_url(video_arg):
+                    if not _cached_exists(video_arg):
                         handle_error(f"Video not found: {video_arg}")
         else:
             if require_image_key:
@@ -41,9 +53,8 @@ def validate_image_configs(image_configs, require_image_key=True, validate_types
 
         if has_image:
             image_arg = config.get("image") or config.get("url")
-            if not is_url(image_arg):
-                image_path = Path(image_arg)
-                if not image_path.exists():
+            if not _cached_is_url(image_arg):
+                if not _cached_exists(image_arg):
                     handle_error(f"Image not found: {image_arg}")
 
         if validate_types:
@@ -58,7 +69,7 @@ def validate_image_configs(image_configs, require_image_key=True, validate_types
 
         # Optional avatar_video (URL for green-screen character video; validated on resolve)
         avatar_val = config.get("avatar_video")
-        if avatar_val and not (is_url(avatar_val) or Path(avatar_val).exists()):
+        if avatar_val and not (_cached_is_url(avatar_val) or _cached_exists(avatar_val)):
             handle_error(f"Invalid 'avatar_video' at index {idx}: must be URL or existing file")
 
 
@@ -69,9 +80,8 @@ def load_and_validate_image_configs(config_path_str, require_image_key=True, val
         handle_error(f"Config file not found: {config_path}")
 
     try:
-        with open(config_path, "r") as f:
-            image_configs = json.load(f)
-    except json.JSONDecodeError as e:
+        image_configs = load_json_file(config_path)
+    except JSONDecodeError as e:
         handle_error(f"Invalid JSON in config file: {e}")
 
     validate_image_configs(image_configs, require_image_key, validate_types)
@@ -0,0 +1,53 @@
+"""JSON loading helpers (orjson when installed, stdlib json otherwise)."""
+import json
+import mmap
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch this either way
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads_json(data):
+    """Parse JSON from bytes/str with orjson if available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(path):
+    """Read and parse a JSON file (raises JSONDecodeError on bad JSON)
+
+    With orjson the file is memory-mapped and parsed in place, skipping the intermediate bytes copy.
+    """
+    if orjson is None:
+        return loads_json(Path(path).read_bytes())
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            return orjson.loads(b'')
+        with mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def load_json_file_cached(path):
+    """Like load_json_file, but repeat loads of an unchanged file reuse the parsed value
+
+    Keyed by path, mtime and size, so edits to the file are picked up. The returned
+    object is shared between callers and must not be mutated.
+    """
+    path = Path(path)
+    stat = path.stat()
+    return _load_json_file_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_json_file_cached(path, mtime_ns, size):
+    """Parse a JSON file once per (path, mtime, size)"""
+    return load_json_file(path)
@@ -1,21 +1,33 @@
 """Video writing and stitching utilities"""
 
 import cv2
+import itertools
+import multiprocessing
+import numpy as np
+import os
+import shutil
 import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 # Updated relative imports for grouped structure (e.g. from video/ to siblings like ../config/)
 from ..config.config import (
     WIDTH, HEIGHT, FPS, DEFAULT_REVEAL_DURATION,
     DEFAULT_TOTAL_DURATION, ZIG_ZAG_AMPLITUDE, OUTPUT_DIR, TEMP_DIR,
-    calculate_dimensions, calculate_cursor_size
+    calculate_dimensions, calculate_cursor_size, get_x264_preset
+)
+from ..image.image_utils import (
+    load_and_resize_image, load_avatar_video_frames, load_video_frames, prefetch_images, read_only_view
+)
+from ..animation.animation import (
+    create_static_hold_frames, calculate_hold_frames,
+    iter_single_reveal_frames, count_single_reveal_frames
 )
-from ..image.image_utils import load_and_resize_image, load_avatar_video_frames, load_video_frames
-from ..animation.animation import create_single_reveal_animation, create_static_hold_frames
 from ..animation.pan_zoom_animation import create_pan_zoom_animation, apply_pan_zoom_to_frames
 from ..cleanup.cleanup_utils import ensure_output_dir
-from ..audio.audio_utils import match_video_to_audio_length
+from ..audio.audio_utils import match_video_to_audio_length, prefetch_media_duration
 from ..aws.aws_utils import upload_to_s3
-from ..captions.caption_overlay import overlay_captions_on_frames
+from ..captions.caption_overlay import overlay_captions_on_frames, iter_overlay_captions
 # Common utils for error handling and config validation
 from ..utils.config_utils import validate_image_configs
 from ..utils.error_handler import handle_error
@@ -23,15 +35,23 @@ from ..utils.error_handler import handle_error
 from ..utils.log_utils import log_success, log_info, log_warning
 
 
-def write_frames_to_video(frames, output_path, width=None, height=None, show_progress=True):
-    """Write frames to a video file
+def write_frames_to_video(frames, output_path, width=None, height=None, show_progress=True,
+                          hold_image=None, hold_frames=0, tune='stillimage', total_frames=None):
+    """Write frames to an H.264 video file
+
+    Raw BGR frames are piped straight into ffmpeg (no intermediate mp4v file or
+    second transcode). Falls back to OpenCV's mp4v writer if ffmpeg is missing.
 
     Args:
-        frames: List of frames (numpy.ndarray)
+        frames: List or iterator of frames (numpy.ndarray, BGR uint8); iterators are streamed
         output_path: Path to output video file
         width: Video width (uses default WIDTH if None)
         height: Video height (uses default HEIGHT if None)
         show_progress: Whether to show progress updates
+        hold_image: Optional still image appended after frames (numpy.ndarray)
+        hold_frames: Number of frames to show hold_image for (ffmpeg clones it via tpad)
+        tune: x264 -tune value ('stillimage' suits reveals; None for camera-motion content)
+        total_frames: Frame count for progress output (defaults to len(frames) when available)
 
     Returns:
         Path: Path to the created video file
@@ -41,52 +61,84 @@ def write_frames_to_video(frames, output_path, width=None, height=None, show_pro
     if height is None:
         height = HEIGHT
 
+    if hold_image is None or hold_frames <= 0:
+        hold_frames = 0
+    if total_frames is None and hasattr(frames, '__len__'):
+        total_frames = len(frames)
+
+    if shutil.which('ffmpeg') is None:
+        log_warning("ffmpeg not found. Video saved as mp4v codec.")
+        if hold_frames:
+            frames = itertools.chain(frames, itertools.repeat(hold_image, hold_frames))
+            total_frames = total_frames and total_frames + hold_frames
+        return _write_frames_mp4v(frames, output_path, width, height, show_progress, total_frames)
+
+    if hold_frames:
+        # Send the still once; ffmpeg repeats it instead of us piping identical frames
+        frames = itertools.chain(frames, [hold_image])
+        total_frames = total_frames and total_frames + 1
+
+    cmd = [
+        'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+        '-f', 'rawvideo', '-vcodec', 'rawvideo',
+        '-s', f'{width}x{height}', '-pix_fmt', 'bgr24', '-r', str(FPS),
+        '-i', '-',
+    ]
+    filters = []
+    if hold_frames > 1:
+        filters.append(f'tpad=stop_mode=clone:stop={hold_frames - 1}')
+    # yuv420p needs even dimensions (e.g. 405x720 for 9:16 @ 720p): pad with white
+    if width % 2 or height % 2:
+        filters.append('pad=ceil(iw/2)*2:ceil(ih/2)*2:color=white')
+    if filters:
+        cmd += ['-vf', ','.join(filters)]
+    cmd += ['-c:v', 'libx264', '-preset', get_x264_preset(height), '-crf', '23', '-threads', '0']
+    if tune:
+        cmd += ['-tune', tune]
+    cmd += ['-pix_fmt', 'yuv420p', '-movflags', '+faststart', str(output_path)]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    try:
+        for frame_idx, frame in enumerate(frames):
+            proc.stdin.write(np.ascontiguousarray(frame).data)
+            # Progress indicator
+            if show_progress and frame_idx % 60 == 0:
+                _print_progress(frame_idx, total_frames)
+    except BrokenPipeError:
+        pass
+    finally:
+        _, stderr = proc.communicate()
+
+    if proc.returncode != 0:
+        raise ValueError(f"ffmpeg failed to encode video: {stderr.decode(errors='replace')}")
+
+    return output_path
+
+
+def _write_frames_mp4v(frames, output_path, width, height, show_progress=True, total_frames=None):
+    """Write frames with OpenCV's mp4v writer (fallback when ffmpeg is unavailable)"""
     fourcc = cv2.VideoWriter_fourcc(*'mp4v')
     out = cv2.VideoWriter(str(output_path), fourcc, FPS, (width, height))
 
     if not out.isOpened():
         raise ValueError(f"Could not open video writer for: {output_path}")
 
-    total_frames = len(frames)
     for frame_idx, frame in enumerate(frames):
         out.write(frame)
         # Progress indicator
         if show_progress and frame_idx % 60 == 0:
-            print(f"Progress: {frame_idx}/{total_frames} frames ({frame_idx*100//total_frames}%)")
+            _print_progress(frame_idx, total_frames)
 
     out.release()
     return output_path
 
 
-def convert_to_h264(video_path):
-    """Convert video to H.264 codec using ffmpeg
-
-    Args:
-        video_path: Path to the video file to convert
-
-    Returns:
-        bool: True if conversion successful, False otherwise
-    """
-    print("\nConverting to H.264 (if ffmpeg available)...")
-    temp_output = video_path.with_suffix('.tmp.mp4')
-
-    try:
-        subprocess.run([
-            'ffmpeg', '-y', '-i', str(video_path),
-            '-c:v', 'libx264', '-preset', 'medium', '-crf', '23',
-            '-pix_fmt', 'yuv420p', str(temp_output)
-        ], check=True, capture_output=True)
-
-        # Replace original with converted
-        video_path.unlink()
-        temp_output.rename(video_path)
-        log_success(f"✓ Converted to H.264: {video_path}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        log_warning("ffmpeg not found or failed. Video saved as mp4v codec.")
-        if temp_output.exists():
-            temp_output.unlink()
-        return False
+def _print_progress(frame_idx, total_frames):
+    """Print encoder progress (percentage only when the total is known)"""
+    if total_frames:
+        print(f"Progress: {frame_idx}/{total_frames} frames ({frame_idx*100//total_frames}%)")
+    else:
+        print(f"Progress: {frame_idx} frames")
 
 
 def create_reveal_video(image_path, output_path, pencil_cursor, pencil_cursor_size,
@@ -137,6 +189,10 @@ def create_reveal_video(image_path, output_path, pencil_cursor, pencil_cursor_si
     # Ensure output directory and resolve path
     output_path = _resolve_output_path(output_path)
 
+    # Probe the music's duration in the background while frames render
+    if audio_path:
+        prefetch_media_duration(audio_path)
+
     # Load and prepare image
     print(f"Loading image: {image_path}")
     main_image = load_and_resize_image(image_path, width, height, cleanup_manager)
@@ -144,23 +200,25 @@ def create_reveal_video(image_path, output_path, pencil_cursor, pencil_cursor_si
     print(f"Generating diagonal zig-zag animation...")
     print(f"Reveal duration: {reveal_duration}s, Total duration: {total_duration}s")
 
-    # Create animation frames
-    frames = create_single_reveal_animation(main_image, pencil_cursor, pencil_cursor_size,
-                                           reveal_duration, total_duration, ZIG_ZAG_AMPLITUDE)
+    # Stream animation frames to the encoder; without captions the static hold is left to ffmpeg
+    include_hold = bool(captions)
+    frames = iter_single_reveal_frames(main_image, pencil_cursor, pencil_cursor_size,
+                                       reveal_duration, total_duration, ZIG_ZAG_AMPLITUDE,
+                                       include_hold=include_hold, reuse_buffer=True)
+    total_frames = count_single_reveal_frames(reveal_duration, total_duration, include_hold)
+    hold_frames = 0 if include_hold else calculate_hold_frames(reveal_duration, total_duration)
 
     # Optional: overlay captions (word/letter timing)
     if captions:
-        overlay_captions_on_frames(frames, captions, FPS, width, height, caption_options or {})
+        frames = iter_overlay_captions(frames, captions, FPS, width, height, caption_options or {})
 
     print(f"Creating video: {output_path}")
 
     # Write frames to video
-    write_frames_to_video(frames, output_path, width, height)
+    write_frames_to_video(frames, output_path, width, height, total_frames=total_frames,
+                          hold_image=main_image, hold_frames=hold_frames)
     log_success(f"✓ Video created successfully: {output_path}")
 
-    # Convert to H.264
-    convert_to_h264(Path(output_path))
-
     # Add background music if provided
     if audio_path:
         output_path = _add_audio_to_video(output_path, audio_path, audio_volume, cleanup_manager)
@@ -205,25 +263,27 @@ def create_static_cover_video(image_path, output_path, cleanup_manager=None,
     # Ensure output directory and resolve path
     output_path = _resolve_output_path(output_path)
 
+    # Probe the music's duration in the background while frames render
+    if audio_path:
+        prefetch_media_duration(audio_path)
+
     # Load and prepare image
     print(f"Loading cover image: {image_path}")
     main_image = load_and_resize_image(image_path, width, height, cleanup_manager)
 
-    # Create static frames
+    # Stream the same still image (captions, if any, are drawn on a scratch copy)
     print(f"Creating static cover video ({duration_seconds} second)")
-    frames = create_static_hold_frames(main_image, duration_seconds=duration_seconds)
+    total_frames = int(duration_seconds * FPS)
+    frames = itertools.repeat(read_only_view(main_image), total_frames)
 
     # Optional: overlay captions
     if captions:
-        overlay_captions_on_frames(frames, captions, FPS, width, height, caption_options or {})
+        frames = iter_overlay_captions(frames, captions, FPS, width, height, caption_options or {})
 
     # Write frames to video
-    write_frames_to_video(frames, output_path, width, height)
+    write_frames_to_video(frames, output_path, width, height, total_frames=total_frames)
     log_success(f"✓ Video created successfully: {output_path}")
 
-    # Convert to H.264
-    convert_to_h264(Path(output_path))
-
     # Add background music if provided
     if audio_path:
         output_path = _add_audio_to_video(output_path, audio_path, audio_volume, cleanup_manager)
@@ -242,7 +302,8 @@ def create_static_cover_video(image_path, output_path, cleanup_manager=None,
 
 def create_multi_reveal_video(image_configs, output_path, pencil_cursor, pencil_cursor_size,
                              cleanup_manager=None, audio_path=None, audio_volume=1.0, upload_to_aws=False,
-                             aspect_ratio=None, quality=None, captions=None, caption_options=None):
+                             aspect_ratio=None, quality=None, captions=None, caption_options=None,
+                             max_workers=None):
     """Create a video with multiple image reveals stitched together
 
     Args:
@@ -262,6 +323,10 @@ def create_multi_reveal_video(image_configs, output_path, pencil_cursor, pencil_
         upload_to_aws: Whether to upload to AWS S3 (default False)
         aspect_ratio: Aspect ratio (e.g., '16:9', '9:16', default None uses config default)
         quality: Quality preset (e.g., '720p', '1080p', default None uses config default)
+        captions: Optional caption segments (text, start_sec, end_sec)
+        caption_options: Optional caption style overrides
+        max_workers: Processes rendering clips in parallel (default: half the CPU cores;
+                     1 streams everything through a single encoder)
 
     Returns:
         tuple: (Path to video file, S3 URL if uploaded else None)
@@ -288,64 +353,87 @@ def create_multi_reveal_video(image_configs, output_path, pencil_cursor, pencil_
     # Ensure output directory and resolve path
     output_path = _resolve_output_path(output_path)
 
-    all_frames = []
-    cover_image = None  # Track first cover image
-
-    for idx, config in enumerate(image_configs):
-        # Support both 'image' and 'url' keys
-        image_path = config.get('image') or config.get('url')
-        image_type = config.get('type', 'scene')  # Default to 'scene'
-        seconds = config.get('seconds', DEFAULT_TOTAL_DURATION)
-
-        # Load image
-        main_image = load_and_resize_image(image_path, width, height, cleanup_manager)
-
-        # Handle based on type
-        if image_type == 'cover':
-            # Save first cover, skip animation
-            if cover_image is None:
-                cover_image = main_image
-                print(f"\n[{idx+1}/{len(image_configs)}] Cover image: {image_path}")
-            else:
-                print(f"\n[{idx+1}/{len(image_configs)}] Skipping duplicate cover: {image_path}")
-            continue
-
-        elif image_type == 'scene':
-            # Normal reveal animation
-            # Calculate reveal duration (half of total duration by default)
-            reveal_duration = seconds * 0.5
-            total_duration = seconds
+    # Probe the music's duration in the background while frames render
+    if audio_path:
+        prefetch_media_duration(audio_path)
+
+    # Support both 'image' and 'url' keys
+    image_paths = [config.get('image') or config.get('url') for config in image_configs]
+    has_cover = any(config.get('type', 'scene') == 'cover' for config in image_configs)
+
+    # Frame count is known up front, so frames can be streamed to the encoder
+    total_frames = sum(
+        count_single_reveal_frames(seconds * 0.5, seconds)
+        for seconds in (config.get('seconds', DEFAULT_TOTAL_DURATION)
+                        for config in image_configs if config.get('type', 'scene') == 'scene')
+    )
+    if has_cover:
+        total_frames += int(1.0 * FPS)
+
+    def _iter_clips():
+        """Yield (image, reveal_duration, seconds) per scene in order, then the cover (reveal 0)"""
+        cover_image = None  # Track first cover image
+
+        # Download/decode upcoming images in background threads while the current one renders
+        loaded_images = prefetch_images(image_paths, width, height, cleanup_manager)
+
+        for idx, (config, image_path, main_image) in enumerate(zip(image_configs, image_paths, loaded_images)):
+            image_type = config.get('type', 'scene')  # Default to 'scene'
+            seconds = config.get('seconds', DEFAULT_TOTAL_DURATION)
+
+            # Handle based on type
+            if image_type == 'cover':
+                # Save first cover, skip animation
+                if cover_image is None:
+                    cover_image = main_image
+                    print(f"\n[{idx+1}/{len(image_configs)}] Cover image: {image_path}")
+                else:
+                    print(f"\n[{idx+1}/{len(image_configs)}] Skipping duplicate cover: {image_path}")
+                continue
 
-            print(f"\n[{idx+1}/{len(image_configs)}] Processing scene: {image_path}")
-            print(f"  Duration: {seconds}s (reveal: {reveal_duration}s)")
+            elif image_type == 'scene':
+                # Normal reveal animation
+                # Calculate reveal duration (half of total duration by default)
+                reveal_duration = seconds * 0.5
 
-            # Generate frames for this image
-            frames = create_single_reveal_animation(main_image, pencil_cursor, pencil_cursor_size,
-                                                   reveal_duration, total_duration, ZIG_ZAG_AMPLITUDE)
-            all_frames.extend(frames)
-            print(f"  Generated {len(frames)} frames")
+                print(f"\n[{idx+1}/{len(image_configs)}] Processing scene: {image_path}")
+                print(f"  Duration: {seconds}s (reveal: {reveal_duration}s)")
+                yield main_image, reveal_duration, seconds
 
-    # Append cover image at the end if found
-    if cover_image is not None:
-        print(f"\nAdding cover image buffer (1 second)")
-        cover_frames = create_static_hold_frames(cover_image, duration_seconds=1.0)
-        all_frames.extend(cover_frames)
-        print(f"  Generated {len(cover_frames)} cover frames")
+        # Append cover image at the end if found
+        if cover_image is not None:
+            print(f"\nAdding cover image buffer (1 second)")
+            yield cover_image, 0, 1.0
 
-    # Optional: overlay captions
-    if captions:
-        overlay_captions_on_frames(all_frames, captions, FPS, width, height, caption_options or {})
-
-    # Write all frames to video
     print(f"\nWriting final video: {output_path}")
-    print(f"Total frames: {len(all_frames)}, Duration: {len(all_frames)/FPS:.1f}s")
-
-    write_frames_to_video(all_frames, output_path, width, height)
+    print(f"Total frames: {total_frames}, Duration: {total_frames/FPS:.1f}s")
+
+    scene_count = sum(1 for config in image_configs if config.get('type', 'scene') == 'scene')
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // 2)
+    max_workers = min(max_workers, scene_count + has_cover)
+
+    if max_workers > 1 and shutil.which('ffmpeg') is not None:
+        # Render clips in parallel processes, then join them without re-encoding
+        _render_clips_parallel(_iter_clips(), output_path, pencil_cursor, pencil_cursor_size,
+                               width, height, captions, caption_options, max_workers, cleanup_manager)
+    else:
+        def _iter_all_frames():
+            for main_image, reveal_duration, seconds in _iter_clips():
+                frames, _ = _iter_clip_frames(main_image, reveal_duration, seconds,
+                                              pencil_cursor, pencil_cursor_size)
+                yield from frames
+
+        all_frames = _iter_all_frames()
+
+        # Optional: overlay captions
+        if captions:
+            all_frames = iter_overlay_captions(all_frames, captions, FPS, width, height, caption_options or {})
+
+        # Write all frames to video
+        write_frames_to_video(all_frames, output_path, width, height, total_frames=total_frames)
     log_success(f"✓ Video created successfully: {output_path}")
 
-    # Convert to H.264
-    convert_to_h264(Path(output_path))
-
     # Add background music if provided
     if audio_path:
         output_path = _add_audio_to_video(output_path, audio_path, audio_volume, cleanup_manager)
@@ -362,6 +450,96 @@ def create_multi_reveal_video(image_configs, output_path, pencil_cursor, pencil_
     return output_path, s3_url
 
 
+def _iter_clip_frames(main_image, reveal_duration, seconds, pencil_cursor, pencil_cursor_size,
+                      include_hold=True):
+    """Frames for one multi-reveal clip: a scene reveal, or the still cover when reveal_duration is 0
+
+    Returns:
+        tuple: (frame iterator, hold frames left for the encoder to pad)
+    """
+    if not reveal_duration:
+        return itertools.repeat(read_only_view(main_image), int(seconds * FPS)), 0
+    frames = iter_single_reveal_frames(main_image, pencil_cursor, pencil_cursor_size,
+                                       reveal_duration, seconds, ZIG_ZAG_AMPLITUDE,
+                                       include_hold=include_hold, reuse_buffer=True)
+    hold_frames = 0 if include_hold else calculate_hold_frames(reveal_duration, seconds)
+    return frames, hold_frames
+
+
+def _render_clip(clip_path, main_image, reveal_duration, seconds, pencil_cursor, pencil_cursor_size,
+                 width, height, start_frame, captions, caption_options):
+    """Render one scene (or the cover when reveal_duration is 0) to its own H.264 file
+
+    Runs in a worker process; captions use start_frame so timing matches the full video.
+    """
+    frames, hold_frames = _iter_clip_frames(main_image, reveal_duration, seconds, pencil_cursor,
+                                            pencil_cursor_size, include_hold=bool(captions))
+    if captions:
+        frames = iter_overlay_captions(frames, captions, FPS, width, height, caption_options or {},
+                                       start_frame=start_frame)
+    write_frames_to_video(frames, clip_path, width, height, show_progress=False,
+                          hold_image=main_image, hold_frames=hold_frames)
+    return clip_path
+
+
+def _render_clips_parallel(clips, output_path, pencil_cursor, pencil_cursor_size, width, height,
+                           captions, caption_options, max_workers, cleanup_manager=None):
+    """Render clips on a process pool and stream-copy concatenate them into output_path
+
+    Args:
+        clips: Iterable of (image, reveal_duration, seconds) in playback order
+        output_path: Final video path
+        pencil_cursor: Cursor image with alpha channel
+        pencil_cursor_size: Size of cursor in pixels
+        width: Video width
+        height: Video height
+        captions: Optional caption segments (timed against the full video)
+        caption_options: Optional caption style overrides
+        max_workers: Number of worker processes
+        cleanup_manager: Optional CleanupManager for temp file cleanup
+    """
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    clip_paths = []
+    list_path = TEMP_DIR / f"{output_path.stem}_clips.txt"
+    try:
+        # Spawn, not fork: prefetch_images threads may hold locks (requests, OpenCV, logging) when
+        # the first worker starts, and a forked child would inherit them locked
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            # At most max_workers clips in flight, so the parent never holds (or has pickled)
+            # more decoded images than the workers can take; oldest first keeps errors in order
+            pending = deque()
+            start_frame = 0
+            for clip_idx, (main_image, reveal_duration, seconds) in enumerate(clips):
+                if len(pending) >= max_workers:
+                    pending.popleft().result()
+                clip_path = TEMP_DIR / f"{output_path.stem}_clip{clip_idx:03d}.mp4"
+                clip_paths.append(clip_path)
+                if cleanup_manager:
+                    cleanup_manager.register_temp_file(clip_path)
+                pending.append(executor.submit(
+                    _render_clip, clip_path, main_image, reveal_duration, seconds,
+                    pencil_cursor, pencil_cursor_size, width, height, start_frame,
+                    captions, caption_options))
+                start_frame += count_single_reveal_frames(reveal_duration, seconds)
+            while pending:
+                pending.popleft().result()
+
+        # Concat demuxer with stream copy: clips share encoder settings, so no re-encode
+        list_path.write_text(''.join(f"file '{path.resolve()}'\n" for path in clip_paths))
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-f', 'concat', '-safe', '0', '-i', str(list_path),
+            '-c', 'copy', '-movflags', '+faststart', str(output_path)
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise ValueError(f"ffmpeg failed to concatenate clips: {result.stderr.decode(errors='replace')}")
+    finally:
+        for path in clip_paths + [list_path]:
+            path.unlink(missing_ok=True)
+
+
 def _overlay_root_avatars(frames, avatars, fps, width, height, cleanup_manager=None):
     """Overlay root-level avatar videos (green screen) at specific times.
 
@@ -392,6 +570,8 @@ def _overlay_root_avatars(frames, avatars, fps, width, height, cleanup_manager=N
             x = (width - aw) // 2
             if y < 0 or x < 0 or y + ah > height or x + aw > width:
                 continue
+            if not frames[f_idx].flags.writeable:
+                frames[f_idx] = frames[f_idx].copy()
             roi = frames[f_idx][y:y+ah, x:x+aw]
             # Mask fg (non-black; low thresh preserves dark hair)
             gray = cv2.cvtColor(av_resized, cv2.COLOR_BGR2GRAY)
@@ -461,6 +641,10 @@ def create_pan_zoom_video(image_configs, output_path, cleanup_manager=None,
     # Ensure output directory and resolve path
     output_path = _resolve_output_path(output_path)
 
+    # Probe the music's duration in the background while frames render
+    if audio_path:
+        prefetch_media_duration(audio_path)
+
     all_frames = []
 
     for idx, config in enumerate(image_configs):
@@ -509,6 +693,10 @@ def create_pan_zoom_video(image_configs, output_path, cleanup_manager=None,
         if avatar_frames:
             for f_idx, frame in enumerate(frames):
                 if f_idx < len(avatar_frames):
+                    if not frame.flags.writeable:
+                        # Pan-zoom frames are read-only views; copy before compositing
+                        frame = frame.copy()
+                        frames[f_idx] = frame
                     av = avatar_frames[f_idx]
                     target_h = height // 3
                     scale = target_h / av.shape[0]
@@ -528,9 +716,14 @@ def create_pan_zoom_video(image_configs, output_path, cleanup_manager=None,
         all_frames.extend(frames)
         print(f"  Generated {len(frames)} frames")
 
-    # Optional: overlay captions
+    # Optional: overlay captions. Root avatars go on top of them in place, so that case keeps the
+    # list; otherwise captions are drawn as the encoder pulls each frame (no captioned copies kept)
+    output_frames = all_frames
     if captions:
-        overlay_captions_on_frames(all_frames, captions, FPS, width, height, caption_options or {})
+        if avatars:
+            overlay_captions_on_frames(all_frames, captions, FPS, width, height, caption_options or {})
+        else:
+            output_frames = iter_overlay_captions(all_frames, captions, FPS, width, height, caption_options or {})
 
     # Optional root-level avatar overlays (green screen characters at specific times; on top of everything)
     if avatars:
@@ -541,12 +734,9 @@ def create_pan_zoom_video(image_configs, output_path, cleanup_manager=None,
     print(f"\nWriting final video: {output_path}")
     print(f"Total frames: {len(all_frames)}, Duration: {len(all_frames)/FPS:.1f}s")
 
-    write_frames_to_video(all_frames, output_path, width, height)
+    write_frames_to_video(output_frames, output_path, width, height, tune=None, total_frames=len(all_frames))
     log_success(f"✓ Video created successfully: {output_path}")
 
-    # Convert to H.264
-    convert_to_h264(Path(output_path))
-
     # Add background music if provided
     if audio_path:
         output_path = _add_audio_to_video(output_path, audio_path, audio_volume, cleanup_manager)